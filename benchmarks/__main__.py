@@ -0,0 +1,122 @@
+import sys
+import json
+import math
+import time
+import argparse
+import tracemalloc
+
+from jsxtopy.jsxtopy import BACKENDS
+from benchmarks.corpus import SHAPES, generate, element_count
+
+
+"""
+Times JSX conversion across input sizes and reports how it scales
+
+python -m benchmarks                                 # Print a report for the scan backend
+python -m benchmarks --save baseline.json            # ...and save the results as a baseline
+python -m benchmarks --compare baseline.json         # Exit non-zero if anything got slower or bigger than the baseline
+"""
+
+
+DEFAULT_SIZES = [100, 200, 400, 800]
+DEEP_SIZES = [25, 50, 100, 200]  # The lxml backend still recurses once per nesting level, the scan backend doesn't
+
+
+def measure(convert, jsx, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(jsx, False)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        convert(jsx, False)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(timings), peak
+
+
+# Slope of log(time) against log(elements), around 1.0 for linear and 2.0 for quadratic
+def scaling_exponent(rows):
+    if len(rows) < 2 or rows[0]['time'] <= 0:
+        return float('nan')
+    first, last = rows[0], rows[-1]
+    return math.log(last['time'] / first['time']) / math.log(last['elements'] / first['elements'])
+
+
+def run_benchmarks(backends, shapes, sizes, repeat, seed):
+    results = {}
+    for backend in backends:
+        for shape in shapes:
+            rows = []
+            for size in (DEEP_SIZES if shape == 'deep' and sizes == DEFAULT_SIZES else sizes):
+                jsx = generate(shape, size, seed)
+                row = {'elements': element_count(shape, size), 'bytes': len(jsx)}
+                results[f'{backend}/{shape}/{size}'] = row
+                try:
+                    elapsed, peak = measure(BACKENDS[backend], jsx, repeat)
+                except Exception as e:  # Like the lxml backend running out of recursion depth, the other sizes still get run
+                    row['error'] = f"{type(e).__name__}: {e}"
+                    print(f"{backend:<6} {shape:<12} {row['elements']:>7} {row['bytes']:>9} FAILED: {row['error']}")
+                    continue
+                row.update(time=elapsed, peak=peak)
+                rows.append(row)
+
+                print(f"{backend:<6} {shape:<12} {row['elements']:>7} {row['bytes']:>9} {elapsed * 1000:>10.2f} "
+                      f"{elapsed / row['elements'] * 1e6:>10.2f} {peak / 1024:>10.1f}")
+            print(f"{backend:<6} {shape:<12} scaling exponent: {scaling_exponent(rows):.2f}\n")
+    return results
+
+
+# Returns descriptions of every measurement that got worse than the baseline by more than tolerance
+def find_regressions(results, baseline, tolerance):
+    regressions = []
+    for name, row in results.items():
+        if name not in baseline or 'error' in baseline[name]:
+            continue
+        if 'error' in row:
+            regressions.append(f"{name} failed: {row['error']}")
+            continue
+        for metric in ['time', 'peak']:
+            old, new = baseline[name][metric], row[metric]
+            if old > 0 and new > old * (1 + tolerance):
+                regressions.append(f"{name} {metric}: {old:.6g} -> {new:.6g} (+{(new / old - 1):.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='benchmarks', description='Times JSX conversion across input sizes')
+    parser.add_argument("-b", "--backend", help="Backends to time (default: scan)", choices=BACKENDS, nargs='+', default=['scan'])
+    parser.add_argument("--shape", help="Corpus shapes to generate (default: all)", choices=SHAPES, nargs='+', default=SHAPES)
+    parser.add_argument("--sizes", help="Corpus sizes to generate", type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", help="Timing repeats, the fastest one is reported", type=int, default=5)
+    parser.add_argument("--seed", help="Corpus generator seed", type=int, default=0)
+    parser.add_argument("--save", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare the results against this saved JSON baseline")
+    parser.add_argument("--tolerance", help="Allowed slowdown against the baseline (default: 0.25)", type=float, default=0.25)
+    args = parser.parse_args()
+
+    print(f"{'engine':<6} {'shape':<12} {'elements':>7} {'bytes':>9} {'time (ms)':>10} {'us/elem':>10} {'peak (KiB)':>10}")
+    results = run_benchmarks(args.backend, args.shape, args.sizes, args.repeat, args.seed)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import random
+
+
+"""
+Seeded generator of synthetic JSX fragments
+
+Each shape stresses a different part of the converter:
+
+deep        - elements nested inside each other
+wide        - many siblings under one parent
+attribs     - elements carrying many number, boolean, string, array and object attributes
+jsx_attribs - elements with JSX as attribute values and arrays of objects, like the MultiSelect sample in run_dev()
+"""
+
+
+SHAPES = ['deep', 'wide', 'attribs', 'jsx_attribs']
+
+COMPONENTS = ['Button', 'Text', 'Badge', 'Group', 'Paper', 'Title', 'Anchor', 'ThemeIcon']
+NATIVE_TAGS = ['div', 'span', 'p', 'li', 'section']
+SIZES = ['xs', 'sm', 'md', 'lg', 'xl']
+COLORS = ['red', 'blue', 'teal', 'grape', 'dimmed']
+WORDS = ['Settings', 'Profile', 'Dashboard', 'Billing', 'Security', 'Logout', 'Messages', 'Team']
+
+
+def _tag(rng):
+    return rng.choice(COMPONENTS + NATIVE_TAGS)
+
+
+def _attribs(rng, count):
+    attribs = []
+    for i in range(count):
+        kind = rng.randrange(6)
+        if kind == 0:
+            attribs.append(f'size{i}="{rng.choice(SIZES)}"')
+        elif kind == 1:
+            attribs.append(f'mx{i}={{{rng.randrange(1, 64)}}}')
+        elif kind == 2:
+            attribs.append(f'opacity{i}={{{rng.randrange(1, 10) / 10}}}')
+        elif kind == 3:
+            attribs.append(f'compact{i}')
+        elif kind == 4:
+            attribs.append(f"data{i}={{{rng.sample(WORDS, 3)}}}")
+        else:
+            attribs.append(f"styles{i}={{{{ color: '{rng.choice(COLORS)}', padding: {rng.randrange(1, 32)} }}}}")
+    return ' '.join(attribs)
+
+
+def _deep(rng, size):
+    opening = ''.join(f'<Box p={{{i % 16}}}>' for i in range(size))
+    return f"{opening}{rng.choice(WORDS)}{'</Box>' * size}"
+
+
+def _sibling(rng, i, attribs):
+    tag = _tag(rng)
+    return f'  <{tag} {attribs}>{rng.choice(WORDS)} {i}</{tag}>'
+
+
+def generate(shape, size, seed=0):
+    rng = random.Random(f'{shape}-{size}-{seed}')
+    if shape == 'deep':
+        return _deep(rng, size)
+    elif shape == 'wide':
+        children = [_sibling(rng, i, f'c="{rng.choice(COLORS)}"') for i in range(size)]
+    elif shape == 'attribs':
+        children = [_sibling(rng, i, _attribs(rng, rng.randrange(4, 10))) for i in range(size)]
+    elif shape == 'jsx_attribs':
+        children = []
+        for i in range(size):
+            if i % 2:
+                icon = f'<IconChevronDown size={{{rng.randrange(8, 24)}}} stroke={{1.5}} />'
+                children.append(f'  <TextInput label="{rng.choice(WORDS)}" rightSection={{{icon}}} />')
+            else:
+                options = ', '.join(f"{{ value: '{word}', label: '{word}' }}" for word in rng.sample(WORDS, 3))
+                children.append(f'  <MultiSelect data={{[{options}]}} placeholder="Pick all that you like" />')
+    else:
+        raise ValueError(f"Unknown corpus shape '{shape}'")
+
+    return '<Stack>\n{}\n</Stack>'.format('\n'.join(children))
+
+
+# Number of elements in a generated fragment, counting JSX attribute values too
+def element_count(shape, size):
+    if shape == 'deep':
+        return size
+    elif shape == 'jsx_attribs':
+        return 1 + size + size // 2
+    return 1 + size
@@ -0,0 +1,80 @@
+import os
+import gc
+import sys
+import argparse
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.corpus import SHAPES, generate, element_count
+
+
+"""
+Compares the memory held by the scanner's JSXElement tree against the equivalent lxml tree
+
+lxml allocates its nodes outside of Python's allocator where tracemalloc can't see them, so both trees are measured
+by the growth of the resident set size, each in a fresh process.  The IR is also measured with tracemalloc.
+
+python -m benchmarks.memory --sizes 1000 4000
+"""
+
+
+def _rss():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _measure(engine, shape, size, seed):
+    jsx = generate(shape, size, seed)
+    if engine == 'lxml':
+        import lxml.html
+        from jsxtopy.jsxtopy import clean_vals
+
+        cleaned = clean_vals(jsx)
+        gc.collect()
+        before = _rss()
+        tree = lxml.html.fragments_fromstring(cleaned)
+        return _rss() - before, None
+
+    from jsxtopy.scanner import scan
+
+    gc.collect()
+    before = _rss()
+    tree = scan(jsx)
+    rss = _rss() - before
+
+    tracemalloc.start()  # Only once the resident size is known, since tracing has memory overhead of its own
+    tree = scan(jsx)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rss, traced
+
+
+# Runs a measurement in its own process so memory freed by earlier measurements can't hide the growth
+def measure(engine, shape, size, seed=0):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_measure, engine, shape, size, seed).result()
+
+
+def main():
+    if not os.path.exists('/proc/self/statm'):
+        sys.exit("Measuring resident memory needs /proc")
+
+    parser = argparse.ArgumentParser(prog='benchmarks.memory', description='Compares IR and lxml tree memory')
+    parser.add_argument("--shape", help="Corpus shapes to generate (default: all but deep)", choices=SHAPES, nargs='+',
+                        default=[shape for shape in SHAPES if shape != 'deep'])
+    parser.add_argument("--sizes", help="Corpus sizes to generate", type=int, nargs='+', default=[1000, 4000])
+    parser.add_argument("--seed", help="Corpus generator seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'shape':<12} {'elements':>8} {'IR traced':>10} {'IR rss':>10} {'lxml rss':>10} {'IR/lxml':>8}")
+    for shape in args.shape:
+        for size in args.sizes:
+            ir_rss, ir_traced = measure('scan', shape, size, args.seed)
+            lxml_rss, _ = measure('lxml', shape, size, args.seed)
+            ratio = ir_rss / lxml_rss if lxml_rss > 0 else float('nan')
+            print(f"{shape:<12} {element_count(shape, size):>8} {ir_traced / 1024:>9.0f}K {ir_rss / 1024:>9.0f}K "
+                  f"{lxml_rss / 1024:>9.0f}K {ratio:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,2 @@
-from jsxtopy.jsxtopy import main, run
+from jsxtopy.jsxtopy import main, run, convert, iter_convert, __version__
+from jsxtopy.converter import Converter
@@ -0,0 +1,97 @@
+import os
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from jsxtopy.jsxtopy import BACKENDS, LAYOUTS, convert
+
+
+"""
+asyncio conversion API
+
+Conversions run on a thread or process pool so they never block the event loop, with a semaphore bounding how many
+are in flight at once:
+
+async with AsyncConverter(executor='process', max_workers=4, timeout=2) as converter:
+    pyified = await converter.convert(jsx)
+    results = await converter.convert_many(snippets)  # In input order, errors in place of their results
+
+A conversion that gets cancelled or times out keeps its slot until the pool is actually done with it, since a
+running thread or process can't be stopped part way, so the limit holds for the work really going on.  Threads
+keep the event loop responsive but take turns on the GIL, use processes to convert in parallel.
+"""
+
+
+EXECUTORS = ['thread', 'process']
+
+
+class AsyncConverter:
+    # executor is 'thread', 'process' or an Executor to use, which is then left for the caller to shut down
+    def __init__(self, executor='thread', max_workers=None, max_concurrency=None, timeout=None, use_dict=False,
+                 backend='scan', layout='indent'):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}")
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}")
+
+        if isinstance(executor, Executor):
+            self.executor = executor
+            self._owns_executor = False
+        elif executor == 'thread':
+            max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+            self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='jsxtopy')
+            self._owns_executor = True
+        elif executor == 'process':
+            max_workers = max_workers or os.cpu_count() or 1
+            self.executor = ProcessPoolExecutor(max_workers)
+            self._owns_executor = True
+        else:
+            raise ValueError(f"executor must be one of {EXECUTORS} or an Executor, not {executor!r}")
+
+        self.max_concurrency = max_concurrency or max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.use_dict = use_dict
+        self.backend = backend
+        self.layout = layout
+        self._semaphore = None  # Made on first use, so it belongs to the loop the conversions run on
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._owns_executor:
+            self.executor.shutdown(wait=False)
+
+    async def _convert(self, jsx, use_dict, backend, layout):
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        await self._semaphore.acquire()
+        try:
+            job = self.executor.submit(convert, jsx, use_dict, backend, None, layout)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(self._semaphore.release)
+            except RuntimeError:  # The loop is already closed
+                pass
+
+        job.add_done_callback(release)
+        return await asyncio.wrap_future(job)  # Cancelling this cancels the job too, if it hasn't started yet
+
+    # Converts one snippet, raising TimeoutError if it takes longer than timeout seconds, queueing included
+    async def convert(self, jsx, use_dict=None, backend=None, layout=None, timeout=None):
+        use_dict = self.use_dict if use_dict is None else use_dict
+        coro = self._convert(jsx, use_dict, backend or self.backend, layout or self.layout)
+        return await asyncio.wait_for(coro, self.timeout if timeout is None else timeout)
+
+    # Converts the snippets concurrently, returning the results in input order, with the exception in place of the
+    # result for any that failed unless return_exceptions is False
+    async def convert_many(self, snippets, use_dict=None, backend=None, layout=None, timeout=None, return_exceptions=True):
+        return await asyncio.gather(*(self.convert(jsx, use_dict, backend, layout, timeout) for jsx in snippets),
+                                    return_exceptions=return_exceptions)
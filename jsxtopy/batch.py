@@ -0,0 +1,133 @@
+import os
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from jsxtopy import profiling
+from jsxtopy.jsxtopy import convert
+from jsxtopy.cache import ConversionCache
+
+
+"""
+Batch conversion of .jsx snippet files
+
+Every .jsx file found in the given directories, globs or file paths gets converted to a .py file, either next to
+the source file or in the same relative location under an output directory.  The conversions are spread across a
+process pool and a failure in one file is reported without stopping the rest of the batch.
+"""
+
+
+JSX_EXT = '.jsx'
+
+_worker_caches = {}  # One cache per worker process, so its size only gets worked out once
+
+
+# Collects (source file, root directory) pairs so outputs can mirror the input tree
+def find_files(paths, extensions=(JSX_EXT,)):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                files.extend((os.path.join(dir_path, name), path) for name in sorted(file_names) if name.endswith(extensions))
+        elif glob.has_magic(path):
+            root = path.split('*')[0].split('?')[0].split('[')[0]
+            root = root if root.endswith(os.sep) else os.path.dirname(root)
+            files.extend((match, root or '.') for match in sorted(glob.glob(path, recursive=True)) if os.path.isfile(match))
+        else:
+            files.append((path, os.path.dirname(path) or '.'))
+    return files
+
+
+def output_path(src, root, out_dir=None):
+    dst = f'{os.path.splitext(src)[0]}.py'
+    if out_dir:
+        dst = os.path.join(out_dir, os.path.relpath(dst, root))
+    return dst
+
+
+def _worker_cache(cache_config):
+    if cache_config is None:
+        return None
+    if cache_config not in _worker_caches:
+        _worker_caches[cache_config] = ConversionCache(*cache_config)
+    return _worker_caches[cache_config]
+
+
+# Runs in a worker process, so any error is handed back instead of raised.  trace_memory is None to not profile,
+# otherwise the profile report of the conversion comes back with the result for the parent to merge
+def convert_file(job):
+    src, dst, use_dict, backend, layout, cache_config, mode, header, trace_memory = job
+    cache = _worker_cache(cache_config)
+    hits = cache.hits if cache else 0
+    profiler = profiling.Profiler(trace_memory) if trace_memory is not None else None
+    try:
+        with open(src, encoding='utf-8') as f:
+            jsx = f.read()
+        if profiler is None:
+            pyified = convert(jsx, use_dict, backend, cache, layout, mode, header)
+        else:
+            with profiling.profiling(profiler):
+                pyified = convert(jsx, use_dict, backend, cache, layout, mode, header)
+
+        os.makedirs(os.path.dirname(dst) or '.', exist_ok=True)
+        with open(dst, 'w', encoding='utf-8') as f:
+            f.write(f"{pyified}\n")
+        return src, len(jsx.encode('utf-8')), cache is not None and cache.hits > hits, None, _report(profiler)
+    except Exception as e:
+        return src, 0, False, f"{type(e).__name__}: {e}", _report(profiler)
+
+
+def _report(profiler):
+    return profiler.report() if profiler is not None else None
+
+
+def _trace_memory(profile):
+    return profile.trace_memory if profile is not None else None
+
+
+# Converts all the .jsx files in paths, returning a list of (source file, error) for the ones that failed.  profile
+# is a Profiler that the workers' reports get merged into, or None
+def run_batch(paths, out_dir=None, workers=None, chunksize=None, use_dict=False, backend='scan', verbose=False, cache=None,
+              layout='indent', mode='calls', header=False, profile=None):
+    cache_config = (cache.cache_dir, cache.max_size) if cache is not None else None
+    jobs = [(src, output_path(src, root, out_dir), use_dict, backend, layout, cache_config, mode, header, _trace_memory(profile))
+            for src, root in find_files(paths)]
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(jobs) // (workers * 4))
+
+    start = time.perf_counter()
+    if workers == 1 or len(jobs) <= 1:
+        results = list(map(convert_file, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(convert_file, jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    failures = []
+    total_bytes = 0
+    for src, size, hit, error, report in results:
+        if report is not None:
+            profile.merge(report)
+        if cache is not None and not error:
+            if hit:
+                cache.hits += 1
+            else:
+                cache.misses += 1
+
+        if error:
+            failures.append((src, error))
+            print(f"ERROR: {src}: {error}")
+        else:
+            total_bytes += size
+            if verbose:
+                print(f"Converted {src}")
+
+    converted = len(results) - len(failures)
+    rate = elapsed if elapsed > 0 else float('inf')
+    print(f"\nConverted {converted} of {len(results)} files ({total_bytes} bytes) in {elapsed:.2f}s: "
+          f"{converted / rate:.1f} files/s, {total_bytes / rate:.0f} bytes/s")
+    if cache is not None:
+        print(cache.summary())
+
+    return failures
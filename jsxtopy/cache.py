@@ -0,0 +1,134 @@
+import os
+import hashlib
+import tempfile
+
+
+"""
+Content addressed on-disk cache of conversion results
+
+Entries are keyed by a hash of the JSX text, the conversion options and the converter version, and stored one file
+per entry.  Reading an entry bumps its modification time, so when the cache grows past its size cap the least
+recently used entries are the ones that get removed.
+
+The total size of the entries is kept in a file next to them and updated by every write, so a write only has to
+walk the cache directory when it's time to evict.  Processes writing at the same time can lose each other's
+updates to the total, which only puts eviction off a little: evicting works the size out from the entries again.
+"""
+
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # Bytes
+SIZE_FILE = 'size'
+
+
+def default_cache_dir():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'jsxtopy')
+
+
+class ConversionCache:
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # Total size of the entries as of the last write
+
+    @staticmethod
+    def key(jsx, *options):
+        from jsxtopy.jsxtopy import __version__
+
+        parts = [__version__, *[repr(option) for option in options], jsx]
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                value = f.read()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        path = self._path(key)
+        data = value.encode('utf-8')
+        try:
+            replaced = os.stat(path).st_size
+        except OSError:
+            replaced = 0
+        try:
+            self._write(path, data)
+        except OSError:
+            return
+
+        size = self._read_size()
+        if size is None:  # New cache, or one from before the total was kept
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size = size + len(data) - replaced
+
+        if self._size > self.max_size:
+            self.evict()
+        else:
+            self._write_size()
+
+    @staticmethod
+    def _write(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # Readers never see a partly written file
+
+    def _read_size(self):
+        try:
+            with open(os.path.join(self.cache_dir, SIZE_FILE), encoding='utf-8') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_size(self):
+        try:
+            self._write(os.path.join(self.cache_dir, SIZE_FILE), str(self._size).encode('utf-8'))
+        except OSError:
+            pass
+
+    def _entries(self):
+        entries = []
+        for dir_path, _, file_names in os.walk(self.cache_dir):
+            if dir_path == self.cache_dir:  # Entries are all in subdirectories, the size file isn't one
+                continue
+            for name in file_names:
+                path = os.path.join(dir_path, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    # Removes least recently used entries until the cache is back under 90% of its size cap
+    def evict(self):
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+        target = self.max_size * 0.9
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+        self._write_size()
+
+    def summary(self):
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0
+        return f"Cache: {self.hits} hits, {self.misses} misses ({ratio:.0%} hit rate)"
@@ -0,0 +1,106 @@
+import threading
+
+from jsxtopy.jsxtopy import (INDENT, BACKENDS, LAYOUTS, MODES, STREAMING_MODES, jsxtopy_lxml, _header, _convert_scan,
+                             _cached, _iter_scan, _write_chunks)
+from jsxtopy.literals import MEMO_SIZE, parse_value
+from jsxtopy.emitter import NATIVE_TAGS, Builder
+
+
+"""
+Reusable converter
+
+A Converter is set up once with its options and then used for any number of conversions:
+
+converter = Converter(use_dict=True, mode='react', indent=2)
+pyified = converter.convert(jsx)
+
+It keeps its own tables between conversions: the element function or type for each tag, worked out up front for
+the native HTML and SVG tags, and the expression built for each attribute value text.  Both are bounded and take
+the place of the module wide memo of parsed values, so long running tools don't share state between converters.
+A Converter can be shared between threads, every conversion gets a builder of its own and the tables only ever
+have entries added or dropped.
+"""
+
+
+# Bounded table that's safe to share between threads.  Lookups are plain dict reads, and adding to a full table drops
+# the oldest entry
+class Memo(dict):
+    def __init__(self, maxsize=MEMO_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key not in self and len(self) >= self.maxsize:
+                del self[next(iter(self))]
+            super().__setitem__(key, value)
+
+
+class Converter:
+    def __init__(self, use_dict=False, backend='scan', layout='indent', mode='calls', indent=INDENT, header=False,
+                 memo_size=MEMO_SIZE, cache=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}")
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}")
+        if mode != 'calls' and backend != 'scan':
+            raise ValueError(f"The {mode} mode needs the scan backend")
+        if backend == 'lxml' and (layout != 'indent' or indent != INDENT):
+            raise ValueError(f"The lxml backend only supports the indent layout with an indent of {INDENT}")
+
+        self.use_dict = use_dict
+        self.backend = backend
+        self.layout = layout
+        self.mode = mode
+        self.indent = indent
+        self.header = _header(mode) if header else ''
+        self.cache = cache
+        self._values = Memo(memo_size)  # Attribute value text -> value node
+        self._tags = Memo(memo_size)  # Tag -> element function or type node
+
+        builder = self._builder()
+        for tag in NATIVE_TAGS:
+            builder.tag(tag)
+
+    def _builder(self):
+        from jsxtopy.react import ReactBuilder
+
+        builder_class = ReactBuilder if self.mode in ['react', 'table'] else Builder
+        return builder_class(self.use_dict, self._values, self._tags, parse_value.__wrapped__)
+
+    def _convert(self, jsx):
+        if self.backend == 'lxml':
+            return jsxtopy_lxml(jsx, self.use_dict)
+        return _convert_scan(jsx, self.mode, self._builder(), self.layout, self.indent)
+
+    def convert(self, jsx):
+        options = (self.use_dict, self.backend, self.layout, self.mode, self.indent)
+        return self.header + _cached(self.cache, self._convert, jsx, *options)
+
+    # Like jsxtopy.iter_convert(), the streaming modes of the scan backend get written out one top level element at a
+    # time
+    def iter_convert(self, jsx):
+        if self.backend != 'scan' or self.mode not in STREAMING_MODES:
+            yield self.header + self._convert(jsx)
+            return
+
+        yield from _iter_scan(jsx, self._builder(), self.layout, self.header, self.indent)
+
+    # Streams the conversion into a file, returning the number of characters written
+    def convert_to_file(self, jsx, path):
+        return _write_chunks(self.iter_convert(jsx), path)
+
+    # Converts the JSX file at path a child of each top level element at a time, without reading the whole file in,
+    # see mapped.py
+    def iter_convert_mapped(self, path):
+        from jsxtopy.mapped import iter_convert_mapped
+
+        return iter_convert_mapped(path, self)
+
+    def convert_mapped(self, path, out_path):
+        from jsxtopy.mapped import convert_mapped
+
+        return convert_mapped(path, out_path, self)
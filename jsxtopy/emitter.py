@@ -0,0 +1,250 @@
+import ast
+
+from jsxtopy import profiling
+from jsxtopy.jsxtopy import INDENT
+from jsxtopy.nodes import JSXElement
+from jsxtopy.literals import parse_value
+
+
+"""
+Python expression tree emitter
+
+JSXElements from the single pass scanner are built into Python ast nodes once:
+
+Div({'id': 'root'}, "Hi")  ->  Call(Name('Div'), [Dict([Constant('id')], [Constant('root')]), Constant('Hi')])
+
+unparse() then writes the tree out in a single pass to either layout:
+
+indent   - the usual layout, with child elements on their own indented lines
+compact  - everything on one line
+"""
+
+
+# HTML and SVG elements, which React takes as tag strings.  SVG has a few with camelCase names
+NATIVE_TAGS = frozenset("""
+    a abbr address area article aside audio b base bdi bdo blockquote body br button canvas caption cite code col
+    colgroup data datalist dd del details dfn dialog div dl dt em embed fieldset figcaption figure footer form h1 h2
+    h3 h4 h5 h6 head header hgroup hr html i iframe img input ins kbd label legend li link main map mark menu meta
+    meter nav noscript object ol optgroup option output p picture pre progress q rp rt ruby s samp script search
+    section select slot small source span strong style sub summary sup table tbody td template textarea tfoot th
+    thead time title tr track u ul var video wbr
+    svg animate animateMotion animateTransform circle clipPath defs desc ellipse feBlend feColorMatrix
+    feComponentTransfer feComposite feConvolveMatrix feDiffuseLighting feDisplacementMap feDistantLight feDropShadow
+    feFlood feFuncA feFuncB feFuncG feFuncR feGaussianBlur feImage feMerge feMergeNode feMorphology feOffset
+    fePointLight feSpecularLighting feSpotLight feTile feTurbulence filter foreignObject g image line linearGradient
+    marker mask metadata mpath path pattern polygon polyline radialGradient rect set stop switch symbol text textPath
+    tspan use view
+""".split())
+
+
+# JSX as an attribute value, which gets emitted as a string holding the converted Python, or as the expression itself
+# when inline
+class JSXValue(ast.expr):
+    _fields = ('elements', 'inline')
+
+
+class Builder:
+    inline_jsx = False  # Whether JSX attribute values get emitted as expressions instead of strings
+
+    # values and tags can be tables shared with other builders, parse is the attribute value parser to fill values from
+    def __init__(self, use_dict=False, values=None, tags=None, parse=parse_value):
+        self.use_dict = use_dict
+        self.parse = parse
+        self._values = {} if values is None else values  # Raw attribute value text -> value node, shared by its uses
+        self._tags = {} if tags is None else tags  # Tag -> node for the element's function or type
+
+    # Builds the elements on an explicit work stack, so nesting depth isn't limited by Python's recursion limit.
+    # Each frame is [element, props, finished child Calls, pending child elements], and JSX attribute values get
+    # frames of their own that fill in their JSXValue's list in place
+    def build(self, elements):
+        calls = []
+        stack = [[None, None, calls, iter(elements)]]
+        while stack:
+            frame = stack[-1]
+            element = next(frame[3], None)
+            if element is None:
+                stack.pop()
+                if frame[0] is not None:
+                    stack[-1][2].append(self.finish(frame[0], frame[1], frame[2]))
+                continue
+
+            call = self.enter(element)
+            if call is not None:
+                frame[2].append(call)
+                continue
+
+            pending = []
+            props = self.props(element.attribs, pending)
+            stack.append([element, props, [], iter(element.elements)])
+            stack.extend([None, None, jsx_value.elements, iter(value)] for jsx_value, value in reversed(pending))
+        return calls
+
+    def element(self, element):
+        return self.build([element])[0]
+
+    # Hook for subclasses, returns an already built Call for element to skip building it
+    def enter(self, element):
+        return None
+
+    # Makes the Call node once the element's children are built
+    def finish(self, element, props, children):
+        args = [props]
+        if children:
+            args.extend(children)
+        else:
+            text = element.text.strip()
+            if text:
+                args.append(ast.Constant(text))
+
+        return ast.Call(self.tag(element.tag), args, [])
+
+    # Node for an element's function, from the tags table
+    def tag(self, tag):
+        node = self._tags.get(tag)
+        if node is None:
+            node = self._tags[tag] = self.tag_node(tag)
+        return node
+
+    def tag_node(self, tag):
+        return ast.Name(tag.capitalize() if tag.islower() else tag, ast.Load())  # Native HTML tags like 'div' need to get capitalized
+
+    # JSX attribute values are left for build() to fill in, as (JSXValue, elements) pairs added to pending
+    def props(self, attrib_lst, pending):
+        attribs = {}
+        for k, v in attrib_lst:
+            if k not in attribs:  # First one wins for duplicate attributes
+                if isinstance(v, list):
+                    attribs[k] = JSXValue([], self.inline_jsx)
+                    pending.append((attribs[k], v))
+                else:
+                    node = self._values.get(v)
+                    if node is None:
+                        with profiling.phase('literals'):
+                            node = self._values[v] = self.value(self.parse(v))
+                    attribs[k] = node
+
+        if not attribs:
+            return ast.Constant(None)
+        if self.use_dict:
+            return ast.Call(ast.Name('dict', ast.Load()), [], [ast.keyword(k, v) for k, v in attribs.items()])
+        return ast.Dict([ast.Constant(k) for k in attribs], list(attribs.values()))
+
+    def value(self, value):
+        if isinstance(value, list):
+            return ast.List([self.value(item) for item in value], ast.Load())
+        elif isinstance(value, dict):
+            return ast.Dict([self.value(k) for k in value], [self.value(v) for v in value.values()])
+        elif isinstance(value, JSXElement):  # JSX nested in an array or object literal
+            return JSXValue(self.value_builder().build([value]), self.inline_jsx)
+        return ast.Constant(value)
+
+    # Builder for JSX found inside literal values, whose source spans are relative to the value text
+    def value_builder(self):
+        return self
+
+
+# Work items for unparse()
+_TEXT, _CALLS, _CALL, _BEGIN_JSX, _END_JSX = range(5)
+
+
+# Literal values only nest as deep as the JS literal they came from, so they're written recursively.  JSX attribute
+# values get an empty slot in out, which the work items queued for them fill in with the repr() of their Python
+def _write_value(out, node, work):
+    if isinstance(node, ast.Constant):
+        out.append(repr(node.value))
+    elif isinstance(node, ast.Name):  # Hoisted props
+        out.append(node.id)
+    elif isinstance(node, JSXValue):
+        out.append(None)
+        work.extend([(_END_JSX, (out, len(out) - 1, node.inline), 0), (_CALLS, node.elements, 1), (_BEGIN_JSX, None, 0)])
+    elif isinstance(node, ast.List):
+        out.append('[')
+        for i, item in enumerate(node.elts):
+            if i:
+                out.append(', ')
+            _write_value(out, item, work)
+        out.append(']')
+    elif isinstance(node, ast.Dict):
+        out.append('{')
+        for i, (k, v) in enumerate(zip(node.keys, node.values)):
+            if i:
+                out.append(', ')
+            _write_value(out, k, work)
+            out.append(': ')
+            _write_value(out, v, work)
+        out.append('}')
+    elif isinstance(node, ast.Call):  # dict(...) props
+        out.append('dict(')
+        for i, keyword in enumerate(node.keywords):
+            if i:
+                out.append(', ')
+            out.append(f'{keyword.arg}=')
+            _write_value(out, keyword.value, work)
+        out.append(')')
+    else:
+        raise TypeError(f"Can't emit {type(node).__name__} node")
+
+
+CHUNK_PIECES = 4096  # Pieces of output gathered up before iter_unparse() hands them out as one chunk
+
+
+# Yields the Python source for a list of element Call nodes in chunks, working through (kind, node, level) items on
+# an explicit stack instead of recursing into child elements.  A Call's JSX attribute values get written before its
+# children, so every slot before the next Call is filled in and the output so far can be handed out
+def iter_unparse(calls, layout='indent', level=1, indent=INDENT):
+    outs = [[]]
+    work = [(_CALLS, calls, level)]
+    while work:
+        kind, node, level = work.pop()
+        out = outs[-1]
+        if kind == _CALL:
+            if len(outs) == 1 and len(out) >= CHUNK_PIECES:
+                yield ''.join(out)
+                out.clear()
+            if isinstance(node, ast.Name):  # Hoisted element
+                out.append(node.id)
+                continue
+
+            value_work = []
+            if isinstance(node.func, ast.Attribute):  # React.createElement(type, props, *children)
+                out.append(f'{node.func.value.id}.{node.func.attr}(')
+                _write_value(out, node.args[0], value_work)
+                out.append(', ')
+                props, children = node.args[1], node.args[2:]
+            else:
+                out.append(f'{node.func.id}(')
+                props, children = node.args[0], node.args[1:]
+            _write_value(out, props, value_work)
+            if children and not isinstance(children[0], ast.Constant):
+                if layout == 'compact':
+                    out.append(', ')
+                    work.append((_TEXT, ')', 0))
+                else:
+                    out.append(f',\n{" " * indent * level}')
+                    work.append((_TEXT, f'\n{" " * indent * (level - 1)})', 0))
+                work.append((_CALLS, children, level + 1))
+            elif children:
+                out.append(f', "{children[0].value}")')
+            else:
+                out.append(')')
+            work.extend(value_work)
+        elif kind == _CALLS:
+            separator = ', ' if layout == 'compact' else f',\n{" " * indent * (level - 1)}'
+            for i in range(len(node) - 1, -1, -1):
+                work.append((_CALL, node[i], level))
+                if i:
+                    work.append((_TEXT, separator, 0))
+        elif kind == _TEXT:
+            out.append(node)
+        elif kind == _BEGIN_JSX:
+            outs.append([])
+        else:
+            parent, slot, inline = node
+            text = ''.join(outs.pop())
+            parent[slot] = text if inline else repr(text)
+    if outs[0]:
+        yield ''.join(outs[0])
+
+
+def unparse(calls, layout='indent', level=1, indent=INDENT):
+    return ''.join(iter_unparse(calls, layout, level, indent))
@@ -0,0 +1,191 @@
+import re
+import os
+
+from jsxtopy.scanner import scan_at, _skip_expr
+from jsxtopy.batch import find_files, output_path
+
+
+"""
+JSX extraction from whole JS/TS source files
+
+Finds every JSX expression in a component file, like return bodies, variable assignments and props, and converts
+them all in one pass over the file.  Most of a source file isn't JSX, so the scanner jumps straight from one quote,
+slash or '<' to the next, skips strings, comments, template literals and regexes whole, and only hands a '<' to the
+JSX scanner when it's in a spot where an expression can start:
+
+return (<Button size="xs">Save</Button>);      ->  Button.tsx:12:13  Button({'size': 'xs'}, "Save")
+const a = b < c;                               ->  just a comparison
+useState<string>('')                           ->  just a TypeScript type argument
+
+Nested JSX comes out as part of the expression it's in, not as a separate one.
+"""
+
+
+SOURCE_EXTS = ('.jsx', '.tsx', '.js')
+
+_INTERESTING = re.compile(r'["\'`/<]')
+_TEMPLATE_SPECIAL = re.compile(r'[`\\]|\$\{')
+_WORD_BEFORE = re.compile(r'[\w$]+$')
+_TS_GENERIC = re.compile(r'<[A-Za-z_$][\w$]*\s*(?:,|extends\b)')  # Generic arrow functions like <T,>(x: T) => x
+_REGEX_END = re.compile(r'(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\[\n])*/[A-Za-z]*')
+
+_EXPR_BEFORE = set('(,=:[!&|?{};+-*%~^>/')  # Characters an expression can follow, '>' as in =>
+_KEYWORDS_BEFORE = {'return', 'yield', 'default', 'case', 'await', 'typeof', 'void', 'in', 'of', 'else', 'do'}
+
+
+# Whether an expression, rather than an operator, can start at pos
+def _expr_position(source, pos):
+    i = pos - 1
+    while i >= 0 and source[i] in ' \t\r\n':
+        i -= 1
+    if i < 0:
+        return True
+
+    c = source[i]
+    if c in _EXPR_BEFORE:
+        return c != '>' or source[i - 1:i + 1] == '=>'
+    m = _WORD_BEFORE.search(source, max(0, i - 7), i + 1)
+    return m is not None and m.group() in _KEYWORDS_BEFORE
+
+
+def _skip_template(source, pos):
+    end = pos + 1
+    while True:
+        m = _TEMPLATE_SPECIAL.search(source, end)
+        if m is None:
+            raise ValueError(f"Unterminated template literal starting at offset {pos}")
+        if m.group() == '`':
+            return m.end()
+        elif m.group() == '\\':
+            end = m.end() + 1
+        else:
+            end = _skip_expr(source, m.start() + 1)
+
+
+# Finds the JSX expressions in source, yielding (start, end, elements) for each and (start, start, error) for the
+# ones that look like JSX but don't parse
+def find_jsx(source):
+    pos = 0
+    n = len(source)
+    while pos < n:
+        m = _INTERESTING.search(source, pos)
+        if m is None:
+            return
+
+        pos = m.start()
+        c = m.group()
+        if c == '<':
+            if _expr_position(source, pos) and not _TS_GENERIC.match(source, pos) and source[pos + 1:pos + 2].isalpha() \
+                    or source.startswith('<>', pos):
+                try:
+                    elements, end = scan_at(source, pos)
+                except ValueError as e:
+                    yield pos, pos, e
+                    pos += 1
+                else:
+                    yield pos, end, elements
+                    pos = end
+            else:
+                pos += 1
+        elif c == '/':
+            if source.startswith('//', pos):
+                end = source.find('\n', pos)
+                pos = n if end < 0 else end + 1
+            elif source.startswith('/*', pos):
+                end = source.find('*/', pos + 2)
+                pos = n if end < 0 else end + 2
+            elif _expr_position(source, pos):
+                m = _REGEX_END.match(source, pos + 1)
+                pos = m.end() if m else pos + 1
+            else:
+                pos += 1
+        elif c == '`':
+            pos = _skip_template(source, pos)
+        else:
+            end = pos + 1
+            while True:  # Strings can't span lines, so a stray quote only skips to the end of its line
+                end = source.find(c, end)
+                newline = source.find('\n', pos)
+                if end < 0 or 0 <= newline < end:
+                    end = n if newline < 0 else newline
+                    break
+                backslashes = 0
+                while source[end - 1 - backslashes] == '\\':
+                    backslashes += 1
+                if backslashes % 2 == 0:
+                    break
+                end += 1
+            pos = end + 1
+
+
+# Converts every JSX expression in source, returning (line, column, jsx, pyified, error) for each, 1-based
+def extract(source, use_dict=False, layout='indent'):
+    from jsxtopy.emitter import Builder, unparse
+
+    builder = Builder(use_dict)
+    results = []
+    line = 1
+    line_start = 0
+    counted = 0
+    for start, end, found in find_jsx(source):
+        line += source.count('\n', counted, start)
+        line_start = source.rfind('\n', 0, start) + 1
+        counted = start
+
+        if isinstance(found, Exception):
+            eol = source.find('\n', start)
+            results.append((line, start - line_start + 1, source[start:eol if eol >= 0 else None], None,
+                            f"{type(found).__name__}: {found}"))
+        else:
+            try:
+                results.append((line, start - line_start + 1, source[start:end], unparse(builder.build(found), layout), None))
+            except Exception as e:
+                results.append((line, start - line_start + 1, source[start:end], None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def format_report(path, results):
+    lines = []
+    for line, column, jsx, pyified, error in results:
+        lines.append(f"{path}:{line}:{column}")
+        lines.append(f"ERROR: {error}" if error else pyified)
+        lines.append('')
+    return '\n'.join(lines)
+
+
+# A .py module with one assignment per JSX expression, each under a comment giving its source location
+def format_stub(path, results):
+    lines = [f"# Converted from {path} by jsxtopy", '']
+    for line, column, jsx, pyified, error in results:
+        lines.append(f"# {path}:{line}:{column}")
+        if error:
+            lines.append(f"# ERROR: {error}")
+        else:
+            lines.append(f"jsx_{line}_{column} = {pyified}")
+        lines.append('')
+    return '\n'.join(lines)
+
+
+# Extracts the JSX from the source files in paths, printing a report or writing .py stubs, returns the error count
+def run_extract(paths, use_dict=False, layout='indent', stub=False, out_dir=None, verbose=False):
+    errors = 0
+    for src, root in find_files(paths, SOURCE_EXTS):
+        try:
+            with open(src, encoding='utf-8') as f:
+                results = extract(f.read(), use_dict, layout)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            print(f"ERROR: {src}: {type(e).__name__}: {e}")
+            errors += 1
+            continue
+
+        errors += sum(1 for result in results if result[4])
+        if stub:
+            dst = output_path(src, root, out_dir)
+            os.makedirs(os.path.dirname(dst) or '.', exist_ok=True)
+            with open(dst, 'w', encoding='utf-8') as f:
+                f.write(format_stub(src, results))
+            if verbose:
+                print(f"Extracted {len(results)} JSX expressions from {src} to {dst}")
+        elif results:
+            print(format_report(src, results))
+    return errors
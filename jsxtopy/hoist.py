@@ -0,0 +1,184 @@
+import re
+import ast
+
+from jsxtopy.jsxtopy import INDENT
+from jsxtopy.emitter import unparse
+
+
+"""
+Common subtree hoisting
+
+Docs pages repeat the same icons, badges and list items over and over.  In the hoist output mode, element subtrees
+that show up more than once and prop dicts shared by several elements are pulled out into module level constants
+that every use refers to, so they're only written out, and only built, once:
+
+<Group><Badge size="xs">New</Badge><Badge size="xs">New</Badge></Group>
+
+BADGE_1 = Badge({'size': 'xs'}, "New")
+
+Group(None,
+    BADGE_1,
+    BADGE_1
+)
+
+React elements and props are never modified once made, so sharing them between uses is safe.  A subtree or dict
+only gets hoisted when that makes the output smaller, and the largest repeated subtrees win over the ones inside
+them.  JSX attribute values are left alone, since they're emitted as strings.
+"""
+
+
+_NOT_NAME = re.compile(r'\W')
+
+
+def _props_text(props):
+    return unparse([ast.Call(ast.Name('_', ast.Load()), [props], [])], 'compact')[2:-1]
+
+
+def _has_props(call):
+    return not (isinstance(call.args[0], ast.Constant) and call.args[0].value is None)
+
+
+# Calls reachable from roots without going through a hoisted Name, parents before children
+def _calls(roots):
+    pending = list(reversed(roots))
+    while pending:
+        call = pending.pop()
+        if isinstance(call, ast.Call):
+            yield call
+            pending.extend(reversed(call.args[1:]))
+
+
+class Hoister:
+    def __init__(self, calls):
+        self.calls = calls
+        self.shapes = {}  # id() of each Call -> shape number, the same for structurally identical subtrees
+        self.sizes = []  # Shape number -> length of the subtree's compact source
+        self.counts = []  # Shape number -> uses left in the output
+        self.names = {}  # Shape number -> Name it was hoisted to
+        self.element_defs = []  # (Name, Call) in the order they were hoisted
+        self.props_defs = []  # (Name, props node)
+        self.total_elements = 0
+        self.total_props = 0
+        self._used_names = {}
+
+    def _name(self, base):
+        n = self._used_names[base] = self._used_names.get(base, 0) + 1
+        return ast.Name(f'{base}_{n}', ast.Load())
+
+    # Numbers every subtree by its structure, bottom up on an explicit stack
+    def _number(self):
+        keys = {}
+        stack = [(call, False) for call in reversed(self.calls)]
+        while stack:
+            call, children_done = stack.pop()
+            children = call.args[1:]
+            has_elements = children and isinstance(children[0], ast.Call)
+            if not children_done and has_elements:
+                stack.append((call, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+
+            props = _props_text(call.args[0])
+            if has_elements:
+                rest = tuple(self.shapes[id(child)] for child in children)
+                size = sum(self.sizes[shape] + 2 for shape in rest)
+            else:
+                rest = children[0].value if children else None
+                size = len(rest) + 4 if children else 0
+            key = (call.func.id, props, rest)
+
+            shape = keys.get(key)
+            if shape is None:
+                shape = keys[key] = len(self.sizes)
+                self.sizes.append(len(call.func.id) + len(props) + size + 2)
+                self.counts.append(0)
+            self.shapes[id(call)] = shape
+            self.counts[shape] += 1
+            self.total_elements += 1
+            self.total_props += _has_props(call)
+
+    # Uses of shape no longer made when its k copies become one, for everything inside it
+    def _discount(self, call, k):
+        for descendant in _calls(call.args[1:]):
+            self.counts[self.shapes[id(descendant)]] -= k
+
+    def _worth_hoisting(self, size, count, name_length):
+        return count > 1 and (count - 1) * size > count * name_length + name_length + 4
+
+    # Swaps repeated subtrees for Names, top down so the largest ones get hoisted first
+    def _hoist_elements(self):
+        pending = [(self.calls, i) for i in range(len(self.calls) - 1, -1, -1)]
+        while pending:
+            args, i = pending.pop()
+            call = args[i]
+            shape = self.shapes[id(call)]
+            if shape in self.names:
+                args[i] = self.names[shape]
+                continue
+
+            base = _NOT_NAME.sub('_', call.func.id).upper()
+            if self._worth_hoisting(self.sizes[shape], self.counts[shape], len(base) + 2):
+                self._discount(call, self.counts[shape] - 1)
+                self.names[shape] = args[i] = self._name(base)
+                self.element_defs.append((args[i], call))
+
+            if len(call.args) > 1 and isinstance(call.args[1], ast.Call):
+                pending.extend((call.args, j) for j in range(len(call.args) - 1, 0, -1))
+
+    # Swaps prop dicts shared by several of the elements still being built for Names
+    def _hoist_props(self):
+        roots = self.calls + [call for _, call in self.element_defs]
+        uses = {}
+        for call in _calls(roots):
+            if _has_props(call):
+                uses.setdefault(_props_text(call.args[0]), []).append(call)
+
+        for text, calls in uses.items():
+            if self._worth_hoisting(len(text), len(calls), len('PROPS_') + 2):
+                name = self._name('PROPS')
+                self.props_defs.append((name, calls[0].args[0]))
+                for call in calls:
+                    call.args[0] = name
+
+    # Element definitions ordered so each one comes after the ones it refers to
+    def _ordered_defs(self):
+        defs = {name.id: call for name, call in self.element_defs}
+        ordered = []
+        done = set()
+        for name, _ in self.element_defs:
+            stack = [(name.id, False)]
+            while stack:
+                def_name, deps_done = stack.pop()
+                if def_name in done:
+                    continue
+                if deps_done:
+                    done.add(def_name)
+                    ordered.append((def_name, defs[def_name]))
+                    continue
+                stack.append((def_name, True))
+                for call in _calls([defs[def_name]]):
+                    stack.extend((arg.id, False) for arg in call.args[1:] if isinstance(arg, ast.Name) and arg.id in defs)
+        return ordered
+
+    def hoist(self, layout='indent', indent=INDENT):
+        original = unparse(self.calls, layout, indent=indent)
+        self._number()
+        self._hoist_elements()
+        self._hoist_props()
+
+        lines = [f'{name.id} = {_props_text(props)}' for name, props in self.props_defs]
+        lines.extend(f'{name} = {unparse([call], layout, indent=indent)}' for name, call in self._ordered_defs())
+        body = unparse(self.calls, layout, indent=indent)
+        source = '\n'.join(lines) + '\n\n' + body if lines else body
+
+        built = list(_calls(self.calls))
+        built_props = sum(1 for call in built if _has_props(call) and not isinstance(call.args[0], ast.Name))
+        saved = len(original) - len(source)
+        report = (f"# Hoisted {len(self.element_defs)} subtrees and {len(self.props_defs)} prop dicts: {saved} bytes "
+                  f"({saved / max(len(original), 1):.0%}) smaller, {self.total_elements - len(built)} fewer elements and "
+                  f"{self.total_props - built_props} fewer prop dicts built per render")
+        return f'{report}\n{source}'
+
+
+def hoist(calls, layout='indent', indent=INDENT):
+    return Hoister(calls).hoist(layout, indent)
@@ -0,0 +1,98 @@
+import hashlib
+
+from jsxtopy.nodes import walk
+from jsxtopy.scanner import scan
+from jsxtopy.emitter import Builder, unparse
+
+
+"""
+Incremental re-conversion of edited JSX
+
+Every element subtree is fingerprinted by a hash of its tag, attributes and text plus the fingerprints of its
+children, worked out bottom-up so each part of the source only gets hashed once however deep it's nested.  When the
+edited JSX is converted again, subtrees whose fingerprint was seen in the previous conversion reuse the expression
+tree built for them last time, so only the elements on the paths to the edits get converted again.  The output is
+always the same as a full conversion with jsxtopy_scan().
+"""
+
+
+# Maps id() of every element, JSX attribute values included, to its subtree's fingerprint.  Strings go in as their
+# repr() and subtrees as their 16 byte fingerprint, each with a marker byte, so different trees can't hash the same
+def fingerprints(elements):
+    keys = {}
+    for element in reversed(list(walk(elements))):  # Descendants come before their ancestors
+        h = hashlib.blake2b(repr(element.tag).encode('utf-8'), digest_size=16)
+        for name, value in element.attribs:
+            h.update(f'A{name!r}'.encode('utf-8'))
+            if isinstance(value, list):
+                h.update(b'[' + b''.join(b'E' + keys[id(item)] for item in value) + b']')
+            else:
+                h.update(f'S{value!r}'.encode('utf-8'))
+        for child in element.children:
+            h.update(f'S{child!r}'.encode('utf-8') if isinstance(child, str) else b'E' + keys[id(child)])
+        keys[id(element)] = h.digest()
+    return keys
+
+
+class IncrementalConverter(Builder):
+    def __init__(self, use_dict=False, layout='indent'):
+        super().__init__(use_dict)
+        self.layout = layout
+        self.reused = 0  # Subtrees reused by the last conversion
+        self.converted = 0  # Elements converted from scratch by the last conversion
+        self._keys = {}  # id() of each element being converted -> fingerprint
+        self._memo = {}  # Fingerprint -> (Call node, fingerprints of the child subtrees)
+        self._new_memo = {}
+        self._child_keys = []
+        self._open = []  # (fingerprint, parent's child fingerprints) for the elements being built
+
+    def convert(self, jsx):
+        self.reused = 0
+        self.converted = 0
+        self._new_memo = {}
+        self._child_keys = []
+        self._open = []
+        self._values = {}  # Reused Calls already hold their nodes, so the tables only need to last one conversion
+        self._tags = {}
+        elements = scan(jsx)
+        self._keys = fingerprints(elements)
+        calls = self.build(elements)
+        self._keys = {}  # The ids are only good while the elements are alive
+        self._memo = self._new_memo  # Anything that wasn't part of this conversion gets dropped
+        return unparse(calls, self.layout)
+
+    # JSX inside literal values is part of the enclosing element's fingerprint, so it doesn't get one of its own
+    def value_builder(self):
+        return Builder(self.use_dict)
+
+    # Carries a reused subtree and all of its descendants over into the new memo
+    def _keep(self, key):
+        keys = [key]
+        while keys:
+            key = keys.pop()
+            if key not in self._new_memo:
+                self._new_memo[key] = self._memo[key]
+                keys.extend(self._new_memo[key][1])
+
+    def enter(self, element):
+        key = self._keys[id(element)]
+        self._child_keys.append(key)
+        if key in self._new_memo:
+            self.reused += 1
+            return self._new_memo[key][0]
+        if key in self._memo:
+            self.reused += 1
+            self._keep(key)
+            return self._memo[key][0]
+
+        self._open.append((key, self._child_keys))
+        self._child_keys = []
+        return None
+
+    def finish(self, element, props, children):
+        call = super().finish(element, props, children)
+        key, parent_keys = self._open.pop()
+        self._new_memo[key] = (call, self._child_keys)
+        self._child_keys = parent_keys
+        self.converted += 1
+        return call
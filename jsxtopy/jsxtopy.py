@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
+import re
 import ast
-import lxml.html
+import sys
 import argparse
-import pyperclip
+import contextlib
+
+from jsxtopy import profiling
+from jsxtopy.scanner import VOID_TAGS, scan
 
 
 """
@@ -19,6 +23,15 @@ Div({'id': 'root'},
 """
 
 
+__version__ = '0.1.5'
+
+INDENT = 4
+OUTPUT_BUFFER = 1024 * 1024  # Bytes buffered by convert_to_file() between writes
+
+_INDEX_TAG = re.compile(r'<(/?)\s*([^\s/>]*)')
+_INDEX_ATTRIB = re.compile(r'''\s*(?:(/?>)|([^\s=/>]+)(?:\s*=\s*(?:"[^"]*"|'[^']*'|(?:[^\s/>]|/(?!>))*))?|/)''')
+
+
 def quote_dict(str_dict):
     dict_items = [item.split(':') for item in str_dict.strip()[1:-1].split(',')]
     quoted_items = [f"""{k.strip() if k[0] in ['"', "'"] else f"'{k.strip()}'"}: {v}""" for k, v in dict_items]
@@ -34,7 +47,8 @@ def fmt_val(str_val, use_dict):
                 quoted_dict = quote_dict(str_val)  # Make sure keys are quoted
                 return ast.literal_eval(quoted_dict)
             elif str_val.strip()[0] == '<' and str_val.strip()[-1] == '>':  # JSX as value
-                return jsxtopy(str_val.strip(), use_dict)
+                with profiling.recursion():
+                    return jsxtopy(str_val.strip(), use_dict)
             elif str_val.lower() in ['true', 'false']:
                 return str_val.lower() == 'true'
             elif '.' in str_val:
@@ -138,79 +152,298 @@ def clean_vals(jsx):
     return ''.join(new_jsx)
 
 
+# Indexes the top level elements of cleaned JSX in one pass over the raw text, as (tag, names, inner start, inner end)
+# tuples.  lxml lowercases tag and attribute names, so the tag is as written and names maps each lowercased attribute
+# name back to how it was written, and the inner offsets are where the element's children are in jsx_
+def index_names(jsx_):
+    index = []
+    stack = []  # (tag, names, inner start) for each open element
+    pos = jsx_.find('<')
+    while pos >= 0:
+        m = _INDEX_TAG.match(jsx_, pos)
+        closing, tag = m.groups()
+        if closing:
+            if any(open_tag == tag for open_tag, _, _ in stack):  # Closing tags that don't match anything get left out
+                while True:
+                    open_tag, names, inner = stack.pop()
+                    if not stack:
+                        index.append((open_tag, names, inner, pos))
+                    if open_tag == tag:
+                        break
+            end = jsx_.find('>', m.end())
+            pos = jsx_.find('<', end) if end >= 0 else -1
+            continue
+
+        names = {}
+        pos = m.end()
+        closed = False
+        while pos < len(jsx_):
+            a = _INDEX_ATTRIB.match(jsx_, pos)
+            if a is None:  # Something that isn't an attribute, like a stray '=', so skip to the end of the tag
+                end = jsx_.find('>', pos)
+                pos = len(jsx_) if end < 0 else end + 1
+                closed = jsx_[end - 1] == '/' if end > 0 else False
+                break
+            pos = a.end()
+            if a.group(1):
+                closed = a.group(1) == '/>'
+                break
+            if a.group(2):
+                names.setdefault(a.group(2).lower(), a.group(2))  # Quoted values, JSX ones included, get skipped whole
+
+        if closed or tag in VOID_TAGS:  # Like the scanner, <br> and <input> never open, but <Input> does
+            if not stack:
+                index.append((tag, names, pos, pos))
+        else:
+            stack.append((tag, names, pos))
+        pos = jsx_.find('<', pos)
+
+    if stack:  # Unclosed, so its children run to the end
+        index.append((*stack[0], len(jsx_)))
+    return index
+
+
 # Recursively turns JSX string into string of function calls
 def jsxtopy(jsx, use_dict, level=1):
-    INDENT = 4
+    import lxml.html  # Only loaded when the lxml backend is used
 
-    jsx_ = clean_vals(jsx)
-    fragments = lxml.html.fragments_fromstring(jsx_)
+    with profiling.phase('clean_vals'):
+        jsx_ = clean_vals(jsx)
+    with profiling.phase('tag_scan'):
+        index = index_names(jsx_)
+    with profiling.phase('lxml_parse'):
+        fragments = lxml.html.fragments_fromstring(jsx_)
 
     py_root = []
-    child_str_lst = []
-    tmp_jsx = jsx_
+    elements = iter([fragment for fragment in fragments if not isinstance(fragment, str)])
 
-    for element in fragments:  # The jsx parameter could be a list of many elements, so loop through them all
-        if len(tmp_jsx) == 0:
-            continue
-        tag = tmp_jsx.strip().split('>')[0].split()[0][1:] if tmp_jsx.strip() else '' # lxml forces lower case so grab the tag name from the raw text, stripping off any attributes
+    for tag, names, inner_start, inner_end in index:  # The jsx parameter could be a list of many elements, so loop through them all
         fmt_tag = tag.capitalize() if tag.islower() else tag  # Native HTML tags like 'div' need to get capitalized
-        attribs = {k: fmt_val(v, use_dict) for k, v in element.attrib.items()}  # Represent numeric values as numbers instead of strings
-
-        # This sets things up for getting the proper tag next in the next pass through the loop
-        tmp_str_lst = [f'<{child}'.strip() for child in tmp_jsx.split('<')]
-        tmp_str_lst = tmp_str_lst[2:] if any(['>' in item for item in tmp_str_lst[:2]]) else tmp_str_lst[3:]  # Skip over any JSX in attrib values
-        if f'</{tag}>' in tmp_str_lst:
-            idx = [tmp for tmp in tmp_str_lst].index(f'</{tag}>')
-            if idx == 0:
-                tmp_str_lst = tmp_str_lst[1:]
-            elif idx > 0:
-                child_str_lst = tmp_str_lst[:idx]  # If there are child elements between the opening and closing tage, save these fragments for later
-                tmp_str_lst = tmp_str_lst[idx+1:]
-
-        tmp_jsx = ''.join(tmp_str_lst)  # Put it all back together
-        # print("tmp_jsx:", tmp_jsx)
+
+        # lxml can split an element up, like <Input> with children which it takes for a void <input>, so skip to the one with this tag
+        element = next((element for element in elements if element.tag == tag.lower()), None)
+        attrib = element.attrib if element is not None else {}
+
+        with profiling.phase('fmt_val'):
+            attribs = {names.get(k, k): fmt_val(v, use_dict) for k, v in attrib.items()}  # Represent numeric values as numbers instead of strings
 
         # Convert the whole attrib dict to a single string for later
-        if len(element.attrib) > 0:
-            if use_dict:
-                attrib_str = ''.join(['dict(', ', '.join([f"{k}={repr(v)}" for k, v in attribs.items()]), ')'])
+        with profiling.phase('assemble'):
+            if len(attrib) > 0:
+                if use_dict:
+                    attrib_str = ''.join(['dict(', ', '.join([f"{k}={repr(v)}" for k, v in attribs.items()]), ')'])
+                else:
+                    attrib_str = str(attribs)
             else:
-                attrib_str = str(attribs)
-        else:
-            attrib_str = None
-
-        if len(element) > 0 or len(child_str_lst) > 0:  # There are child elements that need to be processed
-            child_jsx = ''.join(child_str_lst)
-            # print("child_jsx:", child_jsx)
-            children = jsxtopy(child_jsx, use_dict, level + 1)  # Do the child conversions first
-            py_root.append(f'{fmt_tag}({attrib_str},\n{" " * INDENT * level}{children}\n{" " * INDENT * (level - 1)})')
-            child_str_lst = ''
+                attrib_str = None
+
+        child_jsx = jsx_[inner_start:inner_end]
+        if '<' in child_jsx:  # There are child elements that need to be processed
+            with profiling.recursion():
+                children = jsxtopy(child_jsx, use_dict, level + 1)  # Do the child conversions first
+            with profiling.phase('assemble'):
+                py_root.append(f'{fmt_tag}({attrib_str},\n{" " * INDENT * level}{children}\n{" " * INDENT * (level - 1)})')
         else:  # Child is likely just text here
-            if element.text is not None:
-                text_child = f', "{element.text.strip()}"'
-            elif element.tail is not None:
-                text_child = f', "{element.tail.strip()}"'
-            else:
-                text_child = ''
+            with profiling.phase('assemble'):
+                if element is not None and element.text is not None:
+                    text_child = f', "{element.text.strip()}"'
+                elif element is not None and element.tail is not None:
+                    text_child = f', "{element.tail.strip()}"'
+                else:
+                    text_child = ''
 
-            py_root.append(f'{fmt_tag}({attrib_str}{text_child})')
+                py_root.append(f'{fmt_tag}({attrib_str}{text_child})')
 
     return f',\n{" "*INDENT*(level-1)}'.join(py_root)
 
 
-def run(jsx, use_dict=False, verbose=False):
+# The scan backend's pipeline, shared by the functions below and Converter.  builder is the Builder for the mode and
+# indent the spaces per nesting level
+def _convert_scan(jsx, mode, builder, layout='indent', indent=INDENT, level=1):
+    from jsxtopy.emitter import Builder, unparse
+
+    with profiling.phase('scan'):
+        elements = scan(jsx)
+    with profiling.phase('build'):
+        calls = builder.build(elements)
+    if mode == 'hoist':
+        from jsxtopy.hoist import hoist
+
+        with profiling.phase('hoist'):
+            return hoist(calls, layout, indent)
+    if mode == 'table':
+        from jsxtopy.table import table
+
+        with profiling.phase('build'):
+            calls_size = len(unparse(Builder(builder.use_dict).build(elements), layout, indent=indent))
+        with profiling.phase('emit'):
+            return table(calls, calls_size)
+    with profiling.phase('emit'):
+        return unparse(calls, layout, level, indent)
+
+
+def _builder(mode, use_dict):
+    from jsxtopy.emitter import Builder
+    from jsxtopy.react import ReactBuilder
+
+    return ReactBuilder(use_dict) if mode in ['react', 'table'] else Builder(use_dict)
+
+
+# Converts JSX with the single pass scanner instead of lxml
+def jsxtopy_scan(jsx, use_dict, layout='indent', level=1):
+    return _convert_scan(jsx, 'calls', _builder('calls', use_dict), layout, level=level)
+
+
+def jsxtopy_lxml(jsx, use_dict, layout='indent'):
+    if layout != 'indent':
+        raise ValueError(f"The lxml backend doesn't support the {layout} layout")
+    return jsxtopy(jsx, use_dict)
+
+
+# Repeated subtrees and prop dicts become module level constants, see hoist.py
+def jsxtopy_hoist(jsx, use_dict, layout='indent'):
+    return _convert_scan(jsx, 'hoist', _builder('hoist', use_dict), layout)
+
+
+# Elements become React.createElement() calls instead of wrapper function calls, see react.py
+def jsxtopy_react(jsx, use_dict, layout='indent'):
+    return _convert_scan(jsx, 'react', _builder('react', use_dict), layout)
+
+
+# Elements become nested tuples built by a runtime helper, with a report of the size against the calls output, see
+# table.py.  The layout only applies to the calls output it's compared with
+def jsxtopy_table(jsx, use_dict, layout='indent'):
+    return _convert_scan(jsx, 'table', _builder('table', use_dict), layout)
+
+
+BACKENDS = {'scan': jsxtopy_scan, 'lxml': jsxtopy_lxml}
+LAYOUTS = ['indent', 'compact']
+MODES = {'calls': jsxtopy_scan, 'hoist': jsxtopy_hoist, 'react': jsxtopy_react, 'table': jsxtopy_table}  # All but calls need scan
+STREAMING_MODES = ['calls', 'react']  # Modes that can be written out one element at a time
+
+
+# Imports the output of a mode needs, which header=True puts at the top of it
+def _header(mode):
+    if mode in ['react', 'table']:
+        from jsxtopy.react import HEADER
+
+        return f'{HEADER}\n\n'
+    return ''
+
+
+def _converter(backend, mode):
+    if mode == 'calls':
+        return BACKENDS[backend]
+    if backend != 'scan':
+        raise ValueError(f"The {mode} mode needs the scan backend")
+    return MODES[mode]
+
+
+# Runs convert(jsx) through the cache, if there is one, keyed by the options
+def _cached(cache, convert, jsx, *options):
+    if cache is None:
+        return convert(jsx)
+
+    key = cache.key(jsx, *options)
+    pyified = cache.get(key)
+    if pyified is None:
+        pyified = convert(jsx)
+        cache.put(key, pyified)
+    return pyified
+
+
+# Converts without printing anything, cache hits skip parsing and formatting completely
+def convert(jsx, use_dict=False, backend='scan', cache=None, layout='indent', mode='calls', header=False):
+    pyified = _cached(cache, lambda jsx: _converter(backend, mode)(jsx, use_dict, layout), jsx, use_dict, backend, layout, mode,
+                      INDENT)
+    return _header(mode) + pyified if header else pyified
+
+
+# Scans JSX and yields header, then the top level elements built and written one at a time, so only one of their
+# expression trees is held at once
+def _iter_scan(jsx, builder, layout, header='', indent=INDENT):
+    from jsxtopy.emitter import iter_unparse
+
+    with profiling.phase('scan'):
+        elements = scan(jsx)
+    if header:
+        yield header
+
+    separator = ', ' if layout == 'compact' else ',\n'
+    for i, element in enumerate(elements):
+        if i:
+            yield separator
+        with profiling.phase('build'):
+            calls = builder.build([element])
+        yield from iter_unparse(calls, layout, indent=indent)
+
+
+# Yields the converted Python in chunks as the elements get written out, so neither the whole result nor the whole
+# expression tree has to be held at once.  Only the calls and react modes of the scan backend get written out
+# incrementally, anything else comes as a single chunk
+def iter_convert(jsx, use_dict=False, backend='scan', layout='indent', mode='calls', header=False):
+    if backend != 'scan' or mode not in STREAMING_MODES:
+        yield convert(jsx, use_dict, backend, None, layout, mode, header)
+        return
+
+    yield from _iter_scan(jsx, _builder(mode, use_dict), layout, _header(mode) if header else '')
+
+
+# Writes chunks into the file at path through a buffered writer, returning the number of characters written.  The
+# first chunk is taken before the file gets created, so parse errors don't leave an empty file behind
+def _write_chunks(chunks, path):
+    first = next(chunks, '')
+    with open(path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER) as f:
+        written = f.write(first)
+        for chunk in chunks:
+            written += f.write(chunk)
+        written += f.write('\n')
+    return written
+
+
+# Streams the conversion into a file, returning the number of characters written
+def convert_to_file(jsx, path, use_dict=False, backend='scan', layout='indent', mode='calls', header=False):
+    return _write_chunks(iter_convert(jsx, use_dict, backend, layout, mode, header), path)
+
+
+# profile can be True to print a per-phase report after the result, or a Profiler to collect the report into
+def run(jsx, use_dict=False, verbose=False, backend='scan', cache=None, layout='indent', profile=False, mode='calls',
+        header=False):
     if verbose:
         print(f"\njsx:\n{jsx}\n")
-    pyified = jsxtopy(jsx, use_dict)
+    if profile:
+        profiler = profiling.Profiler() if profile is True else profile
+        with profiling.profiling(profiler):
+            pyified = convert(jsx, use_dict, backend, cache, layout, mode, header)
+    else:
+        pyified = convert(jsx, use_dict, backend, cache, layout, mode, header)
 
     if verbose:
         print(f"pyified:")
     print(f"\n{pyified}\n")
+    if profile is True:
+        print(profiler.text())
 
     return pyified
 
 
-def run_dev(use_dict):
+# Like run(), but streams the result into the file at path instead of printing it, profile being a Profiler or None
+def run_to_file(jsx, path, use_dict=False, verbose=False, backend='scan', layout='indent', profile=None, mode='calls',
+                header=False):
+    if verbose:
+        print(f"\njsx:\n{jsx}\n")
+    if profile is not None:
+        with profiling.profiling(profile):
+            written = convert_to_file(jsx, path, use_dict, backend, layout, mode, header)
+    else:
+        written = convert_to_file(jsx, path, use_dict, backend, layout, mode, header)
+
+    if verbose:
+        print(f"Wrote {written} characters to {path}")
+    return written
+
+
+def run_dev(use_dict, backend='scan'):
     test_jsx = [
         """<MultiSelect
   valueComponent={({ value, label, image, name }) => /* Your custom value component with data properties */}
@@ -241,7 +474,7 @@ def run_dev(use_dict):
     print("--- DEV TESTING ---\n")
     for jsx in test_jsx:
         print(f"jsx:\n{jsx}\n")
-        pyified = jsxtopy(jsx, use_dict)
+        pyified = BACKENDS[backend](jsx, use_dict)
         print(f"pyified:\n{pyified}\n")
         print()
 
@@ -251,10 +484,65 @@ def main():
     group = parser.add_mutually_exclusive_group()
     parser.add_argument("-v", "--verbose", help="Print original JSX and Python result to console", action="store_true")
     parser.add_argument("-d", "--dict", help="Create props as dict function instead of dict literal", action="store_true")
+    parser.add_argument("-b", "--backend", help="Parsing engine to use (default: scan)", choices=BACKENDS, default='scan')
+    parser.add_argument("-o", "--output", help="Write the converted Python to this file instead of the console")
+    parser.add_argument("-l", "--layout", help="Output layout, compact puts everything on one line (default: indent)", choices=LAYOUTS, default='indent')
+    parser.add_argument("-m", "--mode", help="Output mode, hoist pulls repeated subtrees and props out into constants, react makes "
+                                             "React.createElement() calls, table writes the elements as nested tuples (default: calls)",
+                        choices=MODES, default='calls')
+    parser.add_argument("--header", help="Put the imports the output mode needs at the top of the output", action="store_true")
     group.add_argument("jsx", help="JSX string to convert (If not supplied, will try to use what is in clipboard)", nargs='?', const='JSX copied from clipboard')
     group.add_argument("--test", help="Run JSX unit tests", action="store_true")
     group.add_argument("--dev", help="Run JSX development test", action="store_true")
+    group.add_argument("-i", "--input", help="Convert the JSX file INPUT, memory-mapped and written out a child element at a time", metavar='INPUT')
+    group.add_argument("--batch", help="Convert .jsx files in these directories, globs or files to .py files", nargs='+', metavar='PATH')
+    group.add_argument("--extract", help="Convert all the JSX embedded in these .jsx/.tsx/.js source files, directories or globs", nargs='+', metavar='PATH')
+    group.add_argument("--watch", help="Convert .jsx files under DIR to .py files next to them whenever they are created or changed", metavar='DIR')
+    group.add_argument("--stream", help="Convert JSON Lines records from stdin to stdout", action="store_true")
+    group.add_argument("--serve", help="Run a conversion server on a Unix socket, or on stdio if SOCKET is '-'", nargs='?', const='', metavar='SOCKET')
+    parser.add_argument("--connect", help="Convert through a running conversion server instead of in this process", nargs='?', const='', metavar='SOCKET')
+    parser.add_argument("--stats", help="Print the statistics of the server given with --connect", action="store_true")
+    parser.add_argument("--no-cache", help="Don't use the on-disk conversion cache", action="store_true")
+    parser.add_argument("--cache-dir", help="Directory for the conversion cache (default: ~/.cache/jsxtopy)")
+    parser.add_argument("--cache-size", help="Size cap for the conversion cache in MB (default: 64)", type=int, default=64)
+    parser.add_argument("--out-dir", help="Write batch outputs into a mirror tree under this directory instead of next to the inputs")
+    parser.add_argument("-j", "--workers", help="Number of worker processes for batch conversion (default: CPU count)", type=int)
+    parser.add_argument("--chunksize", help="Number of files handed to a batch worker at a time", type=int)
+    parser.add_argument("--bundle", help="Make --batch bundle the .jsx files into this single table-driven module instead", metavar='FILE')
+    parser.add_argument("--stub", help="Make --extract write a .py stub per source file instead of printing a report", action="store_true")
+    parser.add_argument("--poll", help="Make --watch poll the directory tree instead of using inotify", action="store_true")
+    parser.add_argument("--profile", help="Print per-phase timings, call counts and allocations of the conversion to stderr",
+                        nargs='?', const='text', choices=['text', 'json'])
     args = parser.parse_args()
+    if args.output and args.connect is not None:
+        parser.error("--output can't be used with --connect")
+    if args.mode != 'calls' and args.backend != 'scan':
+        parser.error(f"The {args.mode} mode needs the scan backend")
+    if args.mode != 'calls' and args.connect is not None:
+        parser.error("--mode can't be used with --connect")
+    if args.header and args.connect is not None:
+        parser.error("--header can't be used with --connect")
+    if (args.mode != 'calls' or args.header) and args.extract:
+        parser.error("--mode and --header can't be used with --extract")
+    if args.input and (args.mode not in STREAMING_MODES or args.backend != 'scan'):
+        parser.error("--input needs the scan backend and the calls or react mode")
+    if args.bundle and not args.batch:
+        parser.error("--bundle needs --batch")
+    if args.profile and (args.test or args.dev or args.extract or args.bundle or args.serve is not None or args.connect is not None):
+        parser.error("--profile can't be used with --test, --dev, --extract, --bundle, --serve or --connect")
+
+    cache = None
+    if not args.no_cache and not (args.test or args.dev or args.profile or args.serve is not None or args.connect is not None):
+        from jsxtopy.cache import ConversionCache
+
+        cache = ConversionCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    # One report over everything converted, batch and watch workers' reports included
+    profiler = profiling.Profiler() if args.profile else None
+
+    def print_profile():
+        if profiler is not None and profiler.conversions:
+            print(profiler.json() if args.profile == 'json' else profiler.text(), file=sys.stderr)
 
     if args.test:
         import pytest
@@ -263,22 +551,104 @@ def main():
         module_dir = os.path.dirname(__file__)
         pytest.main(['-rA', os.path.join(module_dir, '../tests')])
     elif args.dev:
-        run_dev(args.dict)
+        run_dev(args.dict, args.backend)
+    elif args.input:
+        from jsxtopy.converter import Converter
+
+        converter = Converter(args.dict, layout=args.layout, mode=args.mode, header=args.header)
+        with profiling.profiling(profiler) if profiler is not None else contextlib.nullcontext():
+            if args.output:
+                converter.convert_mapped(args.input, args.output)
+            else:
+                sys.stdout.writelines(converter.iter_convert_mapped(args.input))
+                print()
+        print_profile()
+    elif args.batch and args.bundle:
+        from jsxtopy.table import run_bundle
+
+        failures = run_bundle(args.batch, args.bundle, use_dict=args.dict, layout=args.layout, verbose=args.verbose)
+        sys.exit(1 if failures else 0)
+    elif args.batch:
+        from jsxtopy.batch import run_batch
+
+        failures = run_batch(args.batch, out_dir=args.out_dir, workers=args.workers, chunksize=args.chunksize,
+                             use_dict=args.dict, backend=args.backend, verbose=args.verbose, cache=cache, layout=args.layout,
+                             mode=args.mode, header=args.header, profile=profiler)
+        print_profile()
+        sys.exit(1 if failures else 0)
+    elif args.extract:
+        from jsxtopy.extract import run_extract
+
+        errors = run_extract(args.extract, use_dict=args.dict, layout=args.layout, stub=args.stub, out_dir=args.out_dir, verbose=args.verbose)
+        sys.exit(1 if errors else 0)
+    elif args.watch:
+        from jsxtopy.watch import run_watch
+
+        run_watch(args.watch, use_dict=args.dict, backend=args.backend, cache=cache, layout=args.layout, verbose=args.verbose,
+                  poll=args.poll, mode=args.mode, header=args.header, profile=profiler)
+        print_profile()
+    elif args.stream:
+        from jsxtopy.stream import run_stream
+
+        run_stream(use_dict=args.dict, backend=args.backend, cache=cache, layout=args.layout, mode=args.mode, header=args.header,
+                   profile=profiler)
+        if cache is not None:
+            print(cache.summary(), file=sys.stderr)
+        print_profile()
+    elif args.serve is not None:
+        from jsxtopy.server import ConversionServer, default_socket_path
+
+        server = ConversionServer()
+        if args.serve == '-':
+            server.serve_stdio()
+        else:
+            socket_path = args.serve or default_socket_path()
+            print(f"Serving on {socket_path}", file=sys.stderr)
+            server.serve_unix(socket_path)
+    elif args.connect is not None and args.stats:
+        from jsxtopy.server import Client
+
+        with Client(args.connect) as client:
+            for k, v in client.stats().items():
+                print(f"{k}: {v}")
     else:
+        if args.connect is not None:
+            from jsxtopy.server import Client
+
+            try:
+                client = Client(args.connect)
+            except OSError as e:
+                print(f"ERROR: Could not connect to the conversion server: {e}")
+                sys.exit(1)
+            run_jsx = lambda jsx: client.run(jsx, use_dict=args.dict, verbose=args.verbose, backend=args.backend, layout=args.layout)
+        elif args.output:
+            run_jsx = lambda jsx: run_to_file(jsx, args.output, use_dict=args.dict, verbose=args.verbose, backend=args.backend,
+                                              layout=args.layout, profile=profiler, mode=args.mode, header=args.header)
+        else:
+            run_jsx = lambda jsx: run(jsx, use_dict=args.dict, verbose=args.verbose, backend=args.backend, cache=cache, layout=args.layout,
+                                      profile=profiler, mode=args.mode, header=args.header)
+
         if args.jsx:
             jsx_text = args.jsx
-            run(jsx_text, use_dict=args.dict, verbose=args.verbose)
+            run_jsx(jsx_text)
         else:
+            import pyperclip  # Probing for a clipboard backend is slow, so only do it when the clipboard is needed
+
             if args.verbose:
                 print("JSX not provided, using clipboard contents...")
 
             jsx_text = pyperclip.paste()
             if jsx_text and jsx_text.strip()[0] == '<' and jsx_text.strip()[-1] == '>':
-                result = run(jsx_text, use_dict=args.dict, verbose=args.verbose)
-                pyperclip.copy(result)
+                result = run_jsx(jsx_text)
+                if not args.output:
+                    pyperclip.copy(result)
             else:
                 print("ERROR: Invalid JSX in clipboard!")
 
+        if args.verbose and cache is not None:
+            print(cache.summary())
+        print_profile()
+
 
 if __name__ == '__main__':
     # TODO: Handle function as attribute value
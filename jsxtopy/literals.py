@@ -0,0 +1,208 @@
+import re
+import html
+from functools import lru_cache
+
+from jsxtopy import profiling
+from jsxtopy.scanner import scan_at
+
+
+"""
+JS attribute value parser
+
+Turns the raw text of an attribute value into the Python value it should be emitted as:
+
+size="md"                     ->  'md'
+value="1"  mx=5               ->  1, 5         (quoted and bare values that look like numbers or booleans are coerced)
+withAsterisk                  ->  True
+size={14}  stroke={1.5}       ->  14, 1.5
+data={['React', 'Vue']}       ->  ['React', 'Vue']
+styles={{ color: 'red' }}     ->  {'color': 'red'}
+icons={[<IconX />]}           ->  [JSXElement('IconX', ...)]
+onClick={() => go()}          ->  '() => go()'   (anything that isn't a literal is kept as its source text)
+
+The same few value texts repeat all through a document, so results are memoized in a bounded table and each
+distinct value only gets parsed once.  Returned lists and dicts are shared between uses and must not be modified.
+"""
+
+
+MEMO_SIZE = 4096
+
+_SKIP = re.compile(r'(?:\s+|/\*.*?\*/|//[^\n]*)*', re.S)
+_NUMBER = re.compile(r'[-+]?(?:0[xX][0-9a-fA-F]+|0[oO][0-7]+|0[bB][01]+|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?![\w$])')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_CONSTANTS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class NotLiteral(ValueError):
+    pass
+
+
+def _number(text):
+    text = text.replace('+', '', 1) if text.startswith('+') else text
+    sign = -1 if text.startswith('-') else 1
+    digits = text.lstrip('-')
+    prefix = digits[:2].lower()
+    if prefix in ('0x', '0o', '0b'):
+        return sign * int(digits, {'0x': 16, '0o': 8, '0b': 2}[prefix])
+    if any(c in digits for c in '.eE'):
+        return sign * float(digits)
+    return sign * int(digits)
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def skip(self):
+        self.pos = _SKIP.match(self.text, self.pos).end()
+
+    def expect(self, c):
+        self.skip()
+        if not self.text.startswith(c, self.pos):
+            raise NotLiteral(c)
+        self.pos += 1
+
+    def value(self):
+        self.skip()
+        c = self.text[self.pos:self.pos + 1]
+        if c == '[':
+            return self.array()
+        elif c == '{':
+            return self.object()
+        elif c in ('"', "'", '`'):
+            return self.string()
+        elif c == '<':
+            profiling.count('reparses')  # The scanner already walked this JSX to find the end of the value
+            elements, self.pos = scan_at(self.text, self.pos)
+            if len(elements) != 1:
+                raise NotLiteral(c)
+            return elements[0]
+
+        m = _NUMBER.match(self.text, self.pos)
+        if m:
+            self.pos = m.end()
+            return _number(m.group())
+
+        m = _IDENTIFIER.match(self.text, self.pos)
+        if m and m.group() in _CONSTANTS:
+            self.pos = m.end()
+            return _CONSTANTS[m.group()]
+
+        raise NotLiteral(c)
+
+    def string(self):
+        text = self.text
+        quote = text[self.pos]
+        chars = []
+        pos = self.pos + 1
+        while True:
+            end = min((i for i in (text.find(quote, pos), text.find('\\', pos)) if i >= 0), default=-1)
+            if end < 0:
+                raise NotLiteral(quote)
+            chars.append(text[pos:end])
+            if text[end] == quote:
+                break
+
+            escaped = text[end + 1:end + 2]
+            if escaped == 'u' and text.startswith('{', end + 2):
+                close = text.index('}', end + 2)
+                chars.append(chr(int(text[end + 3:close], 16)))
+                pos = close + 1
+            elif escaped == 'u':
+                chars.append(chr(int(text[end + 2:end + 6], 16)))
+                pos = end + 6
+            elif escaped == 'x':
+                chars.append(chr(int(text[end + 2:end + 4], 16)))
+                pos = end + 4
+            elif escaped == '\n':  # Line continuation
+                pos = end + 2
+            else:
+                chars.append(_ESCAPES.get(escaped, escaped))
+                pos = end + 2
+
+        value = ''.join(chars)
+        if quote == '`' and '${' in value:
+            raise NotLiteral(quote)  # Template literal with interpolation
+        self.pos = end + 1
+        return value
+
+    def array(self):
+        self.pos += 1
+        items = []
+        while True:
+            self.skip()
+            if self.text.startswith(']', self.pos):
+                self.pos += 1
+                return items
+            items.append(self.value())
+            self.skip()
+            if self.text.startswith(',', self.pos):
+                self.pos += 1
+            elif not self.text.startswith(']', self.pos):
+                raise NotLiteral(']')
+
+    def object(self):
+        self.pos += 1
+        items = {}
+        while True:
+            self.skip()
+            c = self.text[self.pos:self.pos + 1]
+            if c == '}':
+                self.pos += 1
+                return items
+
+            if c in ('"', "'"):
+                key = self.string()
+            else:
+                m = _NUMBER.match(self.text, self.pos) or _IDENTIFIER.match(self.text, self.pos)
+                if m is None:
+                    raise NotLiteral(c)  # Spreads and computed keys
+                key = m.group()
+                self.pos = m.end()
+
+            self.expect(':')  # Shorthand properties like { value } aren't literals either
+            items[key] = self.value()
+            self.skip()
+            if self.text.startswith(',', self.pos):
+                self.pos += 1
+            elif not self.text.startswith('}', self.pos):
+                raise NotLiteral('}')
+
+
+# Quoted and bare values are strings, unless they look like a number or a boolean
+def coerce(text):
+    if text.lower() in ('true', 'false'):
+        return text.lower() == 'true'
+    try:
+        return float(text) if '.' in text else int(text)
+    except ValueError:
+        return text
+
+
+# Parses a JS expression that should be a literal, raising NotLiteral when it isn't one
+def parse_literal(text):
+    parser = _Parser(text)
+    value = parser.value()
+    parser.skip()
+    if parser.pos != len(text):
+        raise NotLiteral(text[parser.pos:parser.pos + 1])
+    return value
+
+
+# Parses the raw source text of an attribute value, None being an attribute with no value
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_value(raw):
+    if raw is None:
+        return True
+    elif raw[:1] in ('"', "'"):
+        text = raw[1:-1]
+        return coerce(html.unescape(text) if '&' in text else text)
+    elif raw[:1] == '{':
+        expr = raw[1:-1]
+        try:
+            return parse_literal(expr)
+        except (NotLiteral, ValueError, IndexError):
+            return expr.strip()
+    return coerce(raw)
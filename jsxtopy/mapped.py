@@ -0,0 +1,167 @@
+import os
+import mmap
+import codecs
+
+from jsxtopy import profiling
+from jsxtopy.jsxtopy import STREAMING_MODES, _write_chunks
+from jsxtopy.nodes import JSXElement, EMPTY
+from jsxtopy.scanner import VOID_TAGS, _TAG_NAME, _scan_attribs, scan_element
+from jsxtopy.emitter import iter_unparse, unparse
+
+
+"""
+Memory-mapped conversion of very large JSX files
+
+Exported design tool pages and SVG sprite sheets can run to tens of megabytes, usually as a single root element.
+Instead of reading the whole file into one string, the file is memory-mapped and decoded a window at a time.  Each
+top level element is split at its children: the root's opening tag is written out first, then each child as soon
+as it closes, then the closing parenthesis, so only one child subtree is ever held as text, elements and
+expression nodes at once.  The output is the same as converting the whole file in one go.
+
+A child that doesn't fit in the decoded window makes the window grow, doubling each time, until the child closes.
+Peak memory is then bounded by the largest child of a top level element rather than by the size of the file.
+"""
+
+
+WINDOW = 1024 * 1024  # Bytes decoded at a time
+
+
+# The decoded part of the file, from start on being what hasn't been converted yet
+class _Window:
+    def __init__(self, mm, size=WINDOW):
+        self.mm = mm
+        self.size = size
+        self.offset = 0
+        self.decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self.text = ''
+        self.start = 0
+
+    # Decodes more of the file, as much as is already held so re-scanning an element that didn't fit stays cheap
+    def more(self):
+        if self.offset >= len(self.mm):
+            return False
+        chunk = self.mm[self.offset:self.offset + max(self.size, len(self.text) - self.start)]
+        self.offset += len(chunk)
+        self.text += self.decoder.decode(chunk, self.offset >= len(self.mm))
+        return True
+
+    # Marks everything before pos as converted.  The text only gets cut down once most of it is converted, so
+    # dropping each small element doesn't copy the whole window
+    def drop(self, pos):
+        if pos > len(self.text) // 2:
+            self.text = self.text[pos:]
+            pos = 0
+        self.start = pos
+
+    # Finds sub from pos, decoding more of the file until it turns up with at least one character after it
+    def find(self, sub, pos=0):
+        while True:
+            i = self.text.find(sub, pos)
+            if 0 <= i < len(self.text) - len(sub) or not self.more():
+                return i
+
+    # Runs parse(text), decoding more of the file whenever it runs off the end of what's decoded so far
+    def parse(self, parse):
+        while True:
+            try:
+                with profiling.phase('scan'):
+                    return parse(self.text)
+            except ValueError:
+                if not self.more():
+                    raise
+
+
+def _opening_tag(text, pos):
+    m = _TAG_NAME.match(text, pos + 1)
+    attribs, end, closed = _scan_attribs(text, m.end())
+    return m.group() or 'Fragment', attribs, end, closed or m.group() in VOID_TAGS
+
+
+def _closing_tag(source, lt, tag):
+    gt = source.find('>', lt)
+    if gt < 0:
+        raise ValueError(f"Unterminated closing tag </{source.text[lt + 2:lt + 20]}")
+    closing = source.text[lt + 2:gt].strip() or 'Fragment'
+    if closing != tag:
+        raise ValueError(f"Closing tag </{closing}> does not match <{tag}>")
+    return gt + 1
+
+
+# Yields the converted elements of a top level element that starts at the window's start
+def _iter_element(source, builder, layout, indent):
+    tag, attribs, end, closed = source.parse(lambda text: _opening_tag(text, source.start))
+    if closed:
+        with profiling.phase('build'):
+            calls = builder.build([JSXElement(tag, attribs, EMPTY, 0, end)])
+        source.drop(end)
+        yield from iter_unparse(calls, layout, indent=indent)
+        return
+
+    separator = ', ' if layout == 'compact' else f',\n{" " * indent}'
+    start = source.start
+    pos = end
+    children = 0
+    while True:
+        lt = source.find('<', pos)
+        if lt < 0:
+            raise ValueError(f"Unclosed tag <{tag}>")
+        if source.text.startswith('</', lt):
+            break
+
+        child, pos = source.parse(lambda text: scan_element(text, lt))
+        with profiling.phase('build'):
+            calls = builder.build([child])
+        if not children:
+            with profiling.phase('build'):
+                head = builder.build([JSXElement(tag, attribs, EMPTY, 0, end)])
+            yield unparse(head, layout, indent=indent)[:-1] + separator  # Everything but the closing parenthesis
+        else:
+            yield separator
+        source.drop(pos)
+        pos = source.start
+        children += 1
+        yield from iter_unparse(calls, layout, 2, indent)
+
+    end = _closing_tag(source, lt, tag)
+    if children:
+        source.drop(end)
+        yield ')' if layout == 'compact' else '\n)'
+    else:  # Text only, which is still all in the window
+        element, end = source.parse(lambda text: scan_element(text, start))
+        with profiling.phase('build'):
+            calls = builder.build([element])
+        source.drop(end)
+        yield from iter_unparse(calls, layout, indent=indent)
+
+
+# Yields the converted Python for the JSX file at path in chunks, converter being the Converter with the options
+def iter_convert_mapped(path, converter, window=WINDOW):
+    if converter.backend != 'scan' or converter.mode not in STREAMING_MODES:
+        raise ValueError("Memory-mapped conversion needs the scan backend and the calls or react mode")
+
+    builder = converter._builder()
+    separator = ', ' if converter.layout == 'compact' else ',\n'
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            source = _Window(mm, window)
+            first = True
+            while True:
+                lt = source.find('<', source.start)
+                if lt < 0:
+                    break
+                source.drop(lt)
+                if source.text.startswith('</', source.start):
+                    raise ValueError(f"Unexpected closing tag </{source.text[source.start + 2:source.start + 20]}")
+                if first and converter.header:
+                    yield converter.header
+                elif not first:
+                    yield separator
+                first = False
+                yield from _iter_element(source, builder, converter.layout, converter.indent)
+
+
+# Converts the JSX file at path into the file at out_path, returning the number of characters written
+def convert_mapped(path, out_path, converter, window=WINDOW):
+    return _write_chunks(iter_convert_mapped(path, converter, window), out_path)
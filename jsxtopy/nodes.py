@@ -0,0 +1,67 @@
+"""
+Intermediate representation of scanned JSX
+
+The scanner produces these once and the emitter, the incremental converter and any analysis passes work from
+them instead of the raw text.  They are kept small so large fragments and batches stay cheap to hold in memory:
+
+JSXElement.tag       - tag name with its original casing, 'Fragment' for <></>
+JSXElement.attribs   - ordered (name, value) pairs, where value is the raw attribute text or a list of JSXElements
+                       for JSX as an attribute value
+JSXElement.children  - child JSXElements and text strings in source order
+JSXElement.start/end - the element's span in the source text
+"""
+
+
+EMPTY = ()  # Shared by every element without attributes or children
+
+
+class JSXElement:
+    __slots__ = ('tag', 'attribs', 'children', 'start', 'end')
+
+    def __init__(self, tag, attribs=EMPTY, children=EMPTY, start=0, end=0):
+        self.tag = tag
+        self.attribs = attribs
+        self.children = children
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f'JSXElement({self.tag!r}, {self.attribs!r}, {self.children!r}, {self.start}, {self.end})'
+
+    @property
+    def text(self):
+        return ''.join(child for child in self.children if isinstance(child, str))
+
+    @property
+    def elements(self):
+        return [child for child in self.children if not isinstance(child, str)]
+
+
+# Visits every element in document order, including JSX attribute values, without recursing
+def walk(elements):
+    pending = list(reversed(elements))
+    while pending:
+        element = pending.pop()
+        yield element
+
+        nested = [child for child in element.children if not isinstance(child, str)]
+        for _, value in element.attribs:
+            if isinstance(value, list):
+                nested[:0] = value
+        pending.extend(reversed(nested))
+
+
+# Bytes held by the IR objects themselves, shared strings and constants aside
+def ir_size(elements):
+    import sys
+
+    size = sys.getsizeof(elements)
+    for element in walk(elements):
+        size += sys.getsizeof(element)
+        if element.attribs is not EMPTY:
+            size += sys.getsizeof(element.attribs)
+            size += sum(sys.getsizeof(attrib) + sys.getsizeof(attrib[1]) for attrib in element.attribs)
+        if element.children is not EMPTY:
+            size += sys.getsizeof(element.children)
+            size += sum(sys.getsizeof(child) for child in element.children if isinstance(child, str))
+    return size
@@ -0,0 +1,175 @@
+import time
+import contextvars
+from contextlib import contextmanager
+
+
+"""
+Per-phase profiling of conversions
+
+While a Profiler is active, the converters record the wall time, call count and allocated bytes of each phase
+they go through, plus counters like the deepest nesting level and how many times JSX got parsed again.  Time and
+bytes are exclusive, so a phase nested in another one (like fmt_val() converting JSX attribute values) doesn't
+get counted twice.  Bytes are the net growth of traced memory, so a phase that frees more than it keeps shows
+up negative.  When no Profiler is active, phase() hands back a shared no-op context manager, so the
+converters only pay for a context variable lookup.
+
+profiler = Profiler()
+with profiling(profiler):
+    jsxtopy_scan(jsx, False)
+print(profiler.text())
+"""
+
+
+_current = contextvars.ContextVar('jsxtopy_profiler', default=None)
+
+
+class _NoPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+def current():
+    return _current.get()
+
+
+def phase(name):
+    profiler = _current.get()
+    return _NO_PHASE if profiler is None else profiler.phase(name)
+
+
+def count(name, n=1):
+    profiler = _current.get()
+    if profiler is not None:
+        profiler.count(name, n)
+
+
+def record_max(name, value):
+    profiler = _current.get()
+    if profiler is not None:
+        profiler.record_max(name, value)
+
+
+# Marks one level of a converter calling itself on text it already parsed once
+def recursion():
+    profiler = _current.get()
+    return _NO_PHASE if profiler is None else profiler.recursion()
+
+
+# Makes profiler the active one for everything converted inside the with block
+@contextmanager
+def profiling(profiler):
+    import tracemalloc  # Only loaded once something gets profiled, it pulls in more modules than the rest of jsxtopy
+
+    token = _current.set(profiler)
+    started_tracing = profiler.trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield profiler
+    finally:
+        profiler.total_seconds += time.perf_counter() - start
+        profiler.conversions += 1
+        if started_tracing:
+            tracemalloc.stop()
+        _current.reset(token)
+
+
+class Profiler:
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.phases = {}  # Name -> [seconds, calls, bytes]
+        self.counters = {}
+        self.total_seconds = 0.0
+        self.conversions = 0
+        self.depth = 0
+        self._stack = []  # [start time, start memory, child seconds, child bytes] for each open phase
+
+    def _memory(self):
+        if not self.trace_memory:
+            return 0
+        import tracemalloc
+
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    @contextmanager
+    def phase(self, name):
+        frame = [time.perf_counter(), self._memory(), 0.0, 0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[0]
+            allocated = self._memory() - frame[1]
+            stats = self.phases.setdefault(name, [0.0, 0, 0])
+            stats[0] += elapsed - frame[2]
+            stats[1] += 1
+            stats[2] += allocated - frame[3]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+                self._stack[-1][3] += allocated
+
+    @contextmanager
+    def recursion(self):
+        self.depth += 1
+        self.count('reparses')
+        self.record_max('max_depth', self.depth + 1)
+        try:
+            yield
+        finally:
+            self.depth -= 1
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def record_max(self, name, value):
+        if value > self.counters.get(name, 0):
+            self.counters[name] = value
+
+    def report(self):
+        return {
+            'conversions': self.conversions,
+            'total_seconds': self.total_seconds,
+            'phases': {name: {'seconds': seconds, 'calls': calls, 'bytes': allocated}
+                       for name, (seconds, calls, allocated) in self.phases.items()},
+            'counters': dict(self.counters),
+        }
+
+    # Adds in a report from another profiler, like one from a batch worker process
+    def merge(self, report):
+        self.conversions += report['conversions']
+        self.total_seconds += report['total_seconds']
+        for name, stats in report['phases'].items():
+            totals = self.phases.setdefault(name, [0.0, 0, 0])
+            totals[0] += stats['seconds']
+            totals[1] += stats['calls']
+            totals[2] += stats['bytes']
+        for name, value in report['counters'].items():
+            if name.startswith('max_'):
+                self.record_max(name, value)
+            else:
+                self.count(name, value)
+
+    def json(self):
+        import json
+
+        return json.dumps(self.report(), indent=2)
+
+    def text(self):
+        lines = [f"Profile of {self.conversions} conversion(s), {self.total_seconds * 1000:.2f} ms total",
+                 f"  {'phase':<12} {'ms':>10} {'%':>6} {'calls':>8} {'net KiB':>10}"]
+        total = self.total_seconds or 1
+        for name, (seconds, calls, allocated) in sorted(self.phases.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {name:<12} {seconds * 1000:>10.2f} {seconds / total:>6.1%} {calls:>8} {allocated / 1024:>10.1f}")
+        other = self.total_seconds - sum(seconds for seconds, _, _ in self.phases.values())  # Imports, caching and glue code
+        lines.append(f"  {'other':<12} {other * 1000:>10.2f} {other / total:>6.1%}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"  {name}: {value}")
+        return '\n'.join(lines)
@@ -0,0 +1,57 @@
+import ast
+
+from jsxtopy.emitter import NATIVE_TAGS, Builder
+
+
+"""
+Direct React.createElement() output
+
+In the react output mode elements become React.createElement() calls instead of calls to the capitalized wrapper
+functions, which saves a Python level call per element on every render in Transcrypt.  Native HTML elements get
+their tag as a string, components are passed as is and fragments become React.Fragment:
+
+<><div id="root"><Button size="lg">Settings</Button></div></>
+
+React.createElement(React.Fragment, None,
+    React.createElement('div', {'id': 'root'},
+        React.createElement(Button, {'size': 'lg'}, "Settings")
+    )
+)
+
+JSX attribute values are emitted as createElement() expressions too, rather than as strings.  HEADER has the import
+the output needs, which can be put at the top of it once.
+"""
+
+
+HEADER = 'from pyreact import React'
+
+_CREATE_ELEMENT = ast.Attribute(ast.Name('React', ast.Load()), 'createElement', ast.Load())
+_FRAGMENT = ast.Name('React.Fragment', ast.Load())
+
+
+# Element type for createElement(), a string for native tags like 'div', 'linearGradient' or 'my-widget' and the name
+# for the rest
+def element_type(tag):
+    if tag == 'Fragment':
+        return _FRAGMENT
+    if tag in NATIVE_TAGS or tag.islower() and '.' not in tag:
+        return ast.Constant(tag)
+    return ast.Name(tag, ast.Load())
+
+
+class ReactBuilder(Builder):
+    inline_jsx = True
+
+    def tag_node(self, tag):
+        return element_type(tag)
+
+    def finish(self, element, props, children):
+        args = [self.tag(element.tag), props]
+        if children:
+            args.extend(children)
+        else:
+            text = element.text.strip()
+            if text:
+                args.append(ast.Constant(text))
+
+        return ast.Call(_CREATE_ELEMENT, args, [])
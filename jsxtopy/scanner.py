@@ -0,0 +1,237 @@
+import re
+import sys
+import html
+
+from jsxtopy import profiling
+from jsxtopy.nodes import JSXElement, EMPTY
+
+
+"""
+Single pass JSX scanner
+
+Walks the raw JSX text once, left to right, keeping open elements on an explicit stack, and produces JSXElement
+nodes.  Attribute values are kept as their raw source text, quotes and braces included, for parse_value() in
+literals.py.  The exception is JSX as a value, like rightSection={<Loader size="xs" />}, which is scanned straight
+into a list of elements.  Tag and attribute names are interned, along with short attribute values, since the same
+few of them repeat all through a document.  For the same reason, (name, value) pairs with short values and
+attribute tuples without JSX values are shared between the elements of a scan that have the same ones.
+"""
+
+
+# HTML elements that never have children, so they don't need to be explicitly closed
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+INTERN_MAX = 32  # Attribute values up to this long are interned, since values like "md" repeat all the time
+
+_WS = re.compile(r'\s*')
+_TAG_NAME = re.compile(r'[^\s/>{]*')
+_ATTRIB_NAME = re.compile(r'[^\s=/>]+')
+_BARE_VAL = re.compile(r'[^\s>]+?(?=/?>|\s)')
+_EXPR_SPECIAL = re.compile(r'[{}\[\]()"\'`/<]')
+_JSX_START = re.compile(r'<[A-Za-z>]')
+
+
+def _unescape(text):
+    return html.unescape(text) if '&' in text else text
+
+
+# Finds the end of a JS string or template literal starting at pos, skipping over escaped quotes
+def _skip_string(jsx, pos):
+    quote = jsx[pos]
+    end = pos + 1
+    while True:
+        end = jsx.find(quote, end)
+        if end < 0:
+            raise ValueError(f"Unterminated string starting at offset {pos}")
+
+        backslashes = 0
+        while jsx[end - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return end + 1
+        end += 1
+
+
+# Finds the end of a {...} expression starting at pos, skipping strings, comments and embedded JSX
+def _skip_expr(jsx, pos):
+    depth = 0
+    end = pos
+    while True:
+        m = _EXPR_SPECIAL.search(jsx, end)
+        if m is None:
+            raise ValueError(f"Unbalanced braces starting at offset {pos}")
+
+        end = m.start()
+        c = m.group()
+        if c in '{[(':
+            depth += 1
+            end += 1
+        elif c in '}])':
+            depth -= 1
+            end += 1
+            if depth == 0:
+                return end
+        elif c in '"\'`':
+            end = _skip_string(jsx, end)
+        elif c == '/' and jsx.startswith('/*', end):
+            close = jsx.find('*/', end + 2)
+            if close < 0:
+                raise ValueError(f"Unterminated comment starting at offset {end}")
+            end = close + 2
+        elif c == '/' and jsx.startswith('//', end):
+            close = jsx.find('\n', end)
+            end = close + 1 if close >= 0 else len(jsx)
+        elif c == '<' and _JSX_START.match(jsx, end):
+            _, end = _scan(jsx, end, in_attrib=True)
+        else:
+            end += 1
+
+
+# Reads a {...} attribute value, returning either its raw text, braces included, or the JSX elements it contains
+def _scan_expr(jsx, pos, shared):
+    start = _WS.match(jsx, pos + 1).end()
+    if _JSX_START.match(jsx, start):
+        elements, end = _scan(jsx, start, in_attrib=True, shared=shared)
+        end = _WS.match(jsx, end).end()
+        if not jsx.startswith('}', end):
+            raise ValueError(f"Expected '}}' after JSX attribute value at offset {end}")
+        return elements[:], end + 1  # A copy doesn't carry the spare capacity the list grew with
+
+    end = _skip_expr(jsx, pos)
+    return jsx[pos:end], end
+
+
+# shared maps attribute pairs and tuples to the first of each seen, so elements with the same ones share them
+def _scan_attribs(jsx, pos, shared=None):
+    attribs = []
+    n = len(jsx)
+    shared = {} if shared is None else shared
+    while True:
+        pos = _WS.match(jsx, pos).end()
+        if pos >= n:
+            raise ValueError("Unterminated tag at end of JSX")
+
+        if jsx[pos] == '>':
+            return _share_attribs(attribs, shared), pos + 1, False
+        if jsx.startswith('/>', pos):
+            return _share_attribs(attribs, shared), pos + 2, True
+
+        m = _ATTRIB_NAME.match(jsx, pos)
+        if m is None:
+            raise ValueError(f"Invalid attribute at offset {pos}")
+        name = m.group()
+        pos = _WS.match(jsx, m.end()).end()
+
+        if jsx.startswith('=', pos):
+            pos = _WS.match(jsx, pos + 1).end()
+            c = jsx[pos:pos + 1]
+            if c in ('"', "'"):
+                end = jsx.find(c, pos + 1)
+                if end < 0:
+                    raise ValueError(f"Unterminated attribute value at offset {pos}")
+                value = jsx[pos:end + 1]
+                pos = end + 1
+            elif c == '{':
+                value, pos = _scan_expr(jsx, pos, shared)
+            else:
+                m = _BARE_VAL.match(jsx, pos)
+                if m is None:
+                    raise ValueError(f"Missing value for attribute '{name}' at offset {pos}")
+                value = m.group()
+                pos = m.end()
+        else:
+            value = None  # Boolean attribute with no value
+
+        pair = (sys.intern(name), value)
+        if value is None or isinstance(value, str) and len(value) <= INTERN_MAX:
+            pair = shared.setdefault(pair, (pair[0], value and sys.intern(value)))
+        attribs.append(pair)
+
+
+def _share_attribs(attribs, shared):
+    if not attribs:
+        return EMPTY
+    attribs = tuple(attribs)
+    if any(isinstance(value, list) for _, value in attribs):  # Lists of elements aren't hashable, or the same twice
+        return attribs
+    return shared.setdefault(attribs, attribs)
+
+
+# Scans elements and text starting at pos, returning them along with the offset where scanning stopped.  With one,
+# scanning stops after the first top level element
+def _scan(jsx, pos=0, in_attrib=False, one=False, shared=None):
+    root = JSXElement(None, children=[])
+    shared = {} if shared is None else shared
+    stack = [root]
+    deepest = 0  # Nesting level of the deepest element, for the profiler
+    n = len(jsx)
+
+    while pos < n:
+        if one and root.children and len(stack) == 1:
+            break
+        if in_attrib and len(stack) == 1:  # JSX as an attribute value ends with its last top level element
+            pos = _WS.match(jsx, pos).end()
+            if not jsx.startswith('<', pos):
+                break
+
+        lt = jsx.find('<', pos)
+        if lt < 0:
+            lt = n
+        if lt > pos and len(stack) > 1:
+            text = jsx[pos:lt]
+            if '\n' not in text or not text.isspace():  # Like JSX, drop whitespace that only separates lines
+                stack[-1].children.append(_unescape(text))
+        pos = lt
+        if pos >= n:
+            break
+
+        if jsx.startswith('</', pos):
+            gt = jsx.find('>', pos)
+            if gt < 0:
+                raise ValueError(f"Unterminated closing tag at offset {pos}")
+            tag = jsx[pos + 2:gt].strip() or 'Fragment'
+            if len(stack) == 1:
+                raise ValueError(f"Unexpected closing tag </{tag}> at offset {pos}")
+            element = stack.pop()
+            if element.tag != tag:
+                raise ValueError(f"Closing tag </{tag}> at offset {pos} does not match <{element.tag}>")
+            pos = gt + 1
+            element.end = pos
+            element.children = tuple(element.children) or EMPTY  # Tuples don't carry spare capacity like lists
+            continue
+
+        start = pos
+        m = _TAG_NAME.match(jsx, pos + 1)
+        tag = sys.intern(m.group() or 'Fragment')
+        attribs, pos, closed = _scan_attribs(jsx, m.end(), shared)
+        element = JSXElement(tag, attribs, EMPTY, start, pos)
+        stack[-1].children.append(element)
+        if len(stack) > deepest:
+            deepest = len(stack)
+        if not closed and tag not in VOID_TAGS:
+            element.children = []
+            stack.append(element)
+
+    if len(stack) > 1:
+        raise ValueError(f"Unclosed tag <{stack[-1].tag}>")
+
+    profiling.record_max('max_depth', deepest)
+
+    return root.children, pos
+
+
+# Scans the JSX expression starting at pos in some larger text, returning its elements and the offset after them
+def scan_at(text, pos):
+    return _scan(text, pos, in_attrib=True)
+
+
+# Scans the one element starting at pos, returning it and the offset after it
+def scan_element(text, pos):
+    elements, end = _scan(text, pos, one=True)
+    return elements[0], end
+
+
+# Scans a JSX string into a list of JSXElements
+def scan(jsx):
+    elements, _ = _scan(jsx)
+    return elements
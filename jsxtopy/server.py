@@ -0,0 +1,252 @@
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import struct
+import threading
+import socketserver
+from collections import OrderedDict, deque
+
+from jsxtopy.jsxtopy import BACKENDS, LAYOUTS
+
+
+"""
+Local conversion daemon
+
+Keeps the converter and an in-memory LRU of recent results loaded so editor plugins don't pay for a process start
+on every paste.  Clients talk to it over a Unix domain socket or stdio with length prefixed JSON frames: a 4 byte
+big-endian length followed by that many bytes of UTF-8 JSON.
+
+{"op": "convert", "jsx": "<div>Hi</div>", "dict": false, "backend": "scan", "layout": "indent"}  ->  {"py": "Div(None, \\"Hi\\")"}
+{"op": "stats"}  ->  {"requests": 12, "conversions": 11, "errors": 0, "hit_ratio": 0.5, "p50_ms": 0.1, "p99_ms": 2.3}
+"""
+
+
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+LRU_SIZE = 1024
+LATENCY_SAMPLES = 10000  # Only the most recent conversions count towards the latency percentiles
+
+_HEADER = struct.Struct('>I')
+
+
+def default_socket_path():
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'jsxtopy.sock')
+    return f'/tmp/jsxtopy-{os.getuid()}.sock'
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    while len(data) < size:  # Sockets can hand back partial reads
+        more = stream.read(size - len(data))
+        if not more:
+            return None
+        data += more
+    return data
+
+
+# Returns the next decoded frame, or None when the other end has closed the connection
+def read_frame(stream):
+    header = _read_exact(stream, _HEADER.size)
+    if not header:
+        return None
+
+    size, = _HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes is larger than {MAX_FRAME_SIZE} bytes")
+    data = _read_exact(stream, size)
+    if data is None:
+        return None
+    return json.loads(data.decode('utf-8'))
+
+
+def write_frame(stream, message):
+    data = json.dumps(message).encode('utf-8')
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class ConversionServer:
+    def __init__(self, lru_size=LRU_SIZE):
+        self.lru_size = lru_size
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.requests = 0
+        self.conversions = 0
+        self.errors = 0
+        self.hits = 0
+
+    def convert(self, jsx, use_dict=False, backend='scan', layout='indent'):
+        key = (jsx, use_dict, backend, layout)
+        with self._lock:
+            pyified = self._lru.get(key)
+            if pyified is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return pyified
+
+        pyified = BACKENDS[backend](jsx, use_dict, layout)  # Converted outside the lock so clients don't wait on each other
+
+        with self._lock:
+            self._lru[key] = pyified
+            if len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+        return pyified
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                'requests': self.requests,
+                'conversions': self.conversions,
+                'errors': self.errors,
+                'hits': self.hits,
+                'hit_ratio': self.hits / self.conversions if self.conversions else 0.0,
+                'cached': len(self._lru),
+                'p50_ms': _percentile(latencies, 0.50) * 1000,
+                'p99_ms': _percentile(latencies, 0.99) * 1000,
+            }
+
+    def handle(self, request):
+        with self._lock:
+            self.requests += 1
+
+        op = request.get('op', 'convert') if isinstance(request, dict) else None
+        if op == 'stats':
+            return self.stats()
+        elif op != 'convert':
+            with self._lock:
+                self.errors += 1
+            return {'error': f"ValueError: Unknown request {request!r}"}
+
+        start = time.perf_counter()
+        try:
+            jsx = request.get('jsx')
+            if not isinstance(jsx, str):
+                raise ValueError("Request is missing a 'jsx' string")
+            backend = request.get('backend', 'scan')
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown backend '{backend}'")
+            layout = request.get('layout', 'indent')
+            if layout not in LAYOUTS:
+                raise ValueError(f"Unknown layout '{layout}'")
+            response = {'py': self.convert(jsx, bool(request.get('dict', False)), backend, layout)}
+        except Exception as e:
+            response = {'error': f"{type(e).__name__}: {e}"}
+
+        with self._lock:
+            self.conversions += 1
+            self._latencies.append(time.perf_counter() - start)
+            if 'error' in response:
+                self.errors += 1
+        return response
+
+    # Answers frames on a pair of binary streams until the input is closed
+    def serve_streams(self, infile, outfile):
+        while True:
+            try:
+                request = read_frame(infile)
+            except ValueError as e:  # Also covers bad JSON
+                write_frame(outfile, {'error': f"{type(e).__name__}: {e}"})
+                return
+            if request is None:
+                return
+            write_frame(outfile, self.handle(request))
+
+    def serve_stdio(self):
+        self.serve_streams(sys.stdin.buffer, sys.stdout.buffer)
+
+    def make_unix_server(self, path):
+        if os.path.exists(path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+                raise OSError(f"A server is already listening on {path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(path)  # Left over from a server that didn't shut down cleanly
+            finally:
+                probe.close()
+
+        conversion_server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                conversion_server.serve_streams(self.rfile, self.wfile)
+
+        old_umask = os.umask(0o077)  # Only the current user gets to talk to the socket
+        try:
+            unix_server = socketserver.ThreadingUnixStreamServer(path, Handler)
+        finally:
+            os.umask(old_umask)
+        unix_server.daemon_threads = True
+        return unix_server
+
+    def serve_unix(self, path):
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # Clean up the socket file when asked to stop
+        with self.make_unix_server(path) as unix_server:
+            try:
+                unix_server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(path)
+
+
+class Client:
+    def __init__(self, path=None):
+        self.path = path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(self.path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._stream = self._sock.makefile('rwb')
+
+    def request(self, message):
+        write_frame(self._stream, message)
+        response = read_frame(self._stream)
+        if response is None:
+            raise ConnectionError(f"Server at {self.path} closed the connection")
+        return response
+
+    def convert(self, jsx, use_dict=False, backend='scan', layout='indent'):
+        response = self.request({'op': 'convert', 'jsx': jsx, 'dict': use_dict, 'backend': backend, 'layout': layout})
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response['py']
+
+    def stats(self):
+        return self.request({'op': 'stats'})
+
+    # Same console output as run(), but converted by the server
+    def run(self, jsx, use_dict=False, verbose=False, backend='scan', layout='indent'):
+        if verbose:
+            print(f"\njsx:\n{jsx}\n")
+        pyified = self.convert(jsx, use_dict, backend, layout)
+
+        if verbose:
+            print(f"pyified:")
+        print(f"\n{pyified}\n")
+
+        return pyified
+
+    def close(self):
+        self._stream.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,78 @@
+import sys
+import json
+
+from jsxtopy import profiling
+from jsxtopy.jsxtopy import convert
+
+
+"""
+JSON Lines conversion stream
+
+Reads one {"id": ..., "jsx": ..., "dict": bool} record per line and writes one result record per line as soon as
+it is converted, so a single long running process can serve a whole build:
+
+{"id": 1, "py": "Div(None, \\"Hello\\")"}
+{"id": 2, "error": "ValueError: Unclosed tag <div>"}
+"""
+
+
+MAX_RECORD_SIZE = 16 * 1024 * 1024  # Longest input line that will be buffered, in characters
+
+
+def convert_record(line, use_dict=False, backend='scan', cache=None, layout='indent', mode='calls', header=False):
+    record_id = None
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("Record must be a JSON object")
+
+        record_id = record.get('id')
+        jsx = record.get('jsx')
+        if not isinstance(jsx, str):
+            raise ValueError("Record is missing a 'jsx' string")
+
+        pyified = convert(jsx, bool(record.get('dict', use_dict)), backend, cache, layout, mode, header)
+        return {'id': record_id, 'py': pyified}
+    except Exception as e:
+        return {'id': record_id, 'error': f"{type(e).__name__}: {e}"}
+
+
+# Reads a line without ever holding more than max_size characters of it, returns None for an oversized line
+def read_record(infile, max_size):
+    line = infile.readline(max_size + 1)
+    if len(line) <= max_size or line.endswith('\n'):
+        return line
+
+    while line and not line.endswith('\n'):  # Throw away the rest of the oversized line in bounded chunks
+        line = infile.readline(max_size)
+    return None
+
+
+# Converts records until the input is closed, returning the number of records that had errors.  profile is a
+# Profiler to collect the report of every conversion into, or None
+def run_stream(infile=None, outfile=None, use_dict=False, backend='scan', cache=None, layout='indent',
+               max_record_size=MAX_RECORD_SIZE, mode='calls', header=False, profile=None):
+    infile = infile or sys.stdin
+    outfile = outfile or sys.stdout
+    errors = 0
+
+    while True:
+        line = read_record(infile, max_record_size)
+        if line is None:
+            result = {'id': None, 'error': f"ValueError: Record is longer than {max_record_size} characters"}
+        elif not line:
+            break
+        elif not line.strip():
+            continue
+        elif profile is None:
+            result = convert_record(line, use_dict, backend, cache, layout, mode, header)
+        else:
+            with profiling.profiling(profile):
+                result = convert_record(line, use_dict, backend, cache, layout, mode, header)
+
+        if 'error' in result:
+            errors += 1
+        outfile.write(f"{json.dumps(result)}\n")
+        outfile.flush()
+
+    return errors
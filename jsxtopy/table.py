@@ -0,0 +1,235 @@
+import os
+import ast
+
+from jsxtopy.scanner import scan
+from jsxtopy.emitter import JSXValue, Builder, unparse
+
+
+"""
+Table-driven output for large static markup
+
+Icon sets and other big static fragments make huge modules as nested element calls.  In the table output mode the
+elements are written as nested tuples instead, with tag names and prop keys replaced by indexes into two shared
+tables, and a small runtime helper that turns the tuples into React elements when they're needed:
+
+<svg viewBox="0 0 24 24"><path d="M5 12l5 5l10 -10" /></svg>
+
+TAGS = ('svg', 'path')
+KEYS = ('viewBox', 'd')
+PROPS = ()
+...
+_build((0, (0, '0 0 24 24'), (1, (1, 'M5 12l5 5l10 -10'))))
+
+Each node is (tag index, props, *children), with props a flat tuple of key indexes and values, None, or the index
+of a props tuple used more than once, which go in PROPS.  Native tags are strings and components are referenced by
+name, the same as the react output mode.  A comment at the top reports the size against the calls output.
+bundle() puts any number of fragments into a single module, where the tables and the helper are only written once,
+so an icon set's shared <svg> props are only written once too.
+"""
+
+
+RUNTIME = '''def _value(value):
+    if isinstance(value, tuple):
+        return _build(value)
+    if isinstance(value, list):
+        return [_value(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _value(v) for k, v in value.items()}
+    return value
+
+
+def _build(node):
+    if isinstance(node, str):
+        return node
+    items = PROPS[node[1]] if isinstance(node[1], int) else node[1]
+    props = None
+    if items is not None:
+        props = {}
+        for i in range(0, len(items), 2):
+            props[KEYS[items[i]]] = _value(items[i + 1])
+    return React.createElement(TAGS[node[0]], props, *[_build(child) for child in node[2:]])'''
+
+_FRAGMENT = 'React.Fragment'
+
+
+def _size_report(what, size, calls_size):
+    saved = calls_size - size
+    return (f"# {what}: {size} bytes ({size - len(RUNTIME)} without the runtime helper), {abs(saved)} bytes "
+            f"({abs(saved) / max(calls_size, 1):.0%}) {'smaller' if saved >= 0 else 'larger'} than the calls output ({calls_size} bytes)")
+
+
+class Table:
+    def __init__(self):
+        self.tags = {}  # Tag source text -> index
+        self.keys = {}  # Prop key -> index
+        self.props = {}  # Props tuple source text -> number of uses, then index in PROPS for the shared ones
+        self._value_depth = 0  # How many props values the node being written is nested in
+
+    @staticmethod
+    def _index(table, text):
+        index = table.get(text)
+        if index is None:
+            index = table[text] = len(table)
+        return index
+
+    # Writes the React.createElement() Calls as a single node, wrapped in a fragment if there's more than one.  The
+    # node comes back as a list of pieces for render(), with its props tuples as (text,) so they can still be shared
+    def node(self, calls):
+        out = []
+        if len(calls) == 1:
+            self._write_node(calls[0], out)
+        else:
+            out.append(f'({self._index(self.tags, _FRAGMENT)}, None')
+            for call in calls:
+                out.append(', ')
+                self._write_node(call, out)
+            out.append(')')
+        return out
+
+    # Writes a node and its descendants on an explicit work stack, where a str is output and a Call is still to write
+    def _write_node(self, call, out):
+        work = [call]
+        while work:
+            item = work.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+
+            element_type = item.args[0]
+            tag = repr(element_type.value) if isinstance(element_type, ast.Constant) else element_type.id
+            out.append(f'({self._index(self.tags, tag)}, ')
+            self._write_props(item.args[1], out)
+            work.append(')')
+            for child in reversed(item.args[2:]):
+                work.append(child if isinstance(child, ast.Call) else repr(child.value))
+                work.append(', ')
+
+    def _write_props(self, props, out):
+        if isinstance(props, ast.Dict):
+            items = [(k.value, v) for k, v in zip(props.keys, props.values)]
+        elif isinstance(props, ast.Call):  # dict(...) props
+            items = [(keyword.arg, keyword.value) for keyword in props.keywords]
+        else:
+            out.append('None')
+            return
+
+        pieces = ['(']
+        self._value_depth += 1
+        for i, (k, v) in enumerate(items):
+            pieces.append(f'{", " if i else ""}{self._index(self.keys, k)}, ')
+            self._write_value(v, pieces)
+        self._value_depth -= 1
+        pieces.append(')')
+        text = ''.join(piece[0] if isinstance(piece, tuple) else piece for piece in pieces)  # Props in JSX values stay inline
+        if not self._value_depth:
+            self.props[text] = self.props.get(text, 0) + 1
+        out.append((text,))
+
+    # Literal values only nest as deep as the JS literal they came from, so they're written recursively
+    def _write_value(self, node, out):
+        if isinstance(node, ast.Constant):
+            out.append(repr(node.value))
+        elif isinstance(node, JSXValue):
+            if len(node.elements) == 1:
+                self._write_node(node.elements[0], out)
+            else:
+                out.append('[')
+                for i, call in enumerate(node.elements):
+                    out.append(', ' if i else '')
+                    self._write_node(call, out)
+                out.append(']')
+        elif isinstance(node, ast.List):
+            out.append('[')
+            for i, item in enumerate(node.elts):
+                out.append(', ' if i else '')
+                self._write_value(item, out)
+            out.append(']')
+        elif isinstance(node, ast.Dict):
+            out.append('{')
+            for i, (k, v) in enumerate(zip(node.keys, node.values)):
+                out.append(f'{", " if i else ""}{k.value!r}: ')
+                self._write_value(v, out)
+            out.append('}')
+        else:
+            raise TypeError(f"Can't emit {type(node).__name__} node")
+
+    # Once every node is written, moves the props tuples used more than once into PROPS, the most used first
+    def share_props(self):
+        shared = sorted((text for text, uses in self.props.items() if uses > 1), key=self.props.get, reverse=True)
+        self.props = {text: i for i, text in enumerate(shared) if len(text) > len(str(i))}
+
+    def render(self, pieces):
+        return ''.join(str(self.props.get(piece[0], piece[0])) if isinstance(piece, tuple) else piece for piece in pieces)
+
+    def definitions(self):
+        tags = ', '.join(self.tags) + (',' if len(self.tags) == 1 else '')
+        keys = ', '.join(repr(key) for key in self.keys) + (',' if len(self.keys) == 1 else '')
+        props = ''.join(f'\n    {text},' for text in self.props) + ('\n' if self.props else '')
+        return f'TAGS = ({tags})\nKEYS = ({keys})\nPROPS = ({props})\n\n\n{RUNTIME}'
+
+
+# Writes React.createElement() Calls as table-driven source, calls_size being the length of the calls output
+def table(calls, calls_size):
+    writer = Table()
+    nodes = [writer.node([call]) for call in calls]
+    writer.share_props()
+    body = ', '.join(f'_build({writer.render(node)})' for node in nodes)
+    source = f'{writer.definitions()}\n\n\n{body}'
+    return f'{_size_report("Table output", len(source), calls_size)}\n{source}'
+
+
+# Builds a single module from (name, jsx) pairs, where FRAGMENTS has the table for each name and fragment(name)
+# builds its elements.  Fragments that fail to scan get left out and added to failures as (name, error) if it's
+# given, otherwise the error is raised
+def bundle(fragments, use_dict=False, layout='indent', failures=None):
+    from jsxtopy.react import ReactBuilder
+
+    writer = Table()
+    builder = ReactBuilder(use_dict)
+    calls_builder = Builder(use_dict)
+    entries = []
+    calls_size = 0
+    for name, jsx in fragments:
+        try:
+            elements = scan(jsx)
+        except ValueError as e:
+            if failures is None:
+                raise
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            continue
+        entries.append((name, writer.node(builder.build(elements))))
+        calls_size += len(unparse(calls_builder.build(elements), layout)) + 1  # Each with its newline, like --batch writes them
+
+    writer.share_props()
+    fragments_source = '\n'.join(['FRAGMENTS = {', *(f'    {name!r}: {writer.render(node)},' for name, node in entries), '}'])
+    source = (f'from pyreact import React\n\n{writer.definitions()}\n\n\n{fragments_source}\n\n\n'
+              f'def fragment(name):\n    return _build(FRAGMENTS[name])\n')
+    return f'{_size_report(f"Bundled {len(entries)} fragments", len(source), calls_size)}\n{source}'
+
+
+# Bundles the .jsx files in paths into the module at out_path, named by their path under the directory they were
+# found in.  Returns a list of (source file, error) for the ones that couldn't be converted
+def run_bundle(paths, out_path, use_dict=False, layout='indent', verbose=False):
+    from jsxtopy.batch import find_files
+
+    fragments = []
+    sources = {}
+    for src, root in find_files(paths):
+        name = os.path.splitext(os.path.relpath(src, root))[0].replace(os.sep, '/')
+        sources[name] = src
+        with open(src, encoding='utf-8') as f:
+            fragments.append((name, f.read()))
+        if verbose:
+            print(f"Bundling {src} as {name!r}")
+
+    failures = []
+    source = bundle(fragments, use_dict, layout, failures)
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+
+    for name, error in failures:
+        print(f"ERROR: {sources[name]}: {error}")
+    report = source.split('\n', 1)[0][2:]
+    print(f"{report}, written to {out_path}")
+    return [(sources[name], error) for name, error in failures]
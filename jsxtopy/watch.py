@@ -0,0 +1,204 @@
+import os
+import sys
+import time
+import select
+import struct
+
+from jsxtopy.batch import JSX_EXT, convert_file, output_path, _trace_memory
+
+
+"""
+Watch mode for directories of .jsx snippet files
+
+Created or changed .jsx files under the watched directory get converted to a .py file next to them.  On Linux the
+kernel reports changes through inotify, so an idle watch just sits in select() and a change only costs a look at
+the files it touched.  Elsewhere the tree gets polled instead.  Saves are debounced, so a burst of them turns into
+one conversion per file, and a file whose mtime and size didn't change since it was last seen is skipped.
+"""
+
+
+DEBOUNCE = 0.2  # Seconds without any new changes before the pending files get converted
+POLL_INTERVAL = 1.0
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ONLYDIR = 0x1000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_ONLYDIR
+
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, name length
+_READ_SIZE = 64 * 1024
+
+
+# Maps every .jsx file under root to its (mtime, size) signature
+def scan_tree(root):
+    files = {}
+    dirs = [root]
+    while dirs:
+        try:
+            entries = os.scandir(dirs.pop())
+        except OSError:  # Removed or unreadable since it was found
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.name.endswith(JSX_EXT) and entry.is_file():
+                        st = entry.stat()
+                        files[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+    return files
+
+
+class InotifyWatcher:
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+
+        self._ctypes = ctypes
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            self._raise(root)
+
+        self.root = root
+        self.dirs = {}  # Watch descriptor -> directory path
+        self.add_tree(root)
+
+    def _raise(self, path):
+        errno = self._ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), path)
+
+    # Watches root and every directory below it, returning the .jsx files already in them
+    def add_tree(self, root):
+        found = []
+        for dir_path, dir_names, file_names in os.walk(root):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dir_path), WATCH_MASK)
+            if wd < 0:
+                self._raise(dir_path)
+            self.dirs[wd] = dir_path
+            found.extend(os.path.join(dir_path, name) for name in file_names if name.endswith(JSX_EXT))
+        return found
+
+    # Waits up to timeout seconds (forever for None) for changes, returning the .jsx files that may have changed
+    def changes(self, timeout=None):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = os.fsdecode(data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0'))
+                offset += _EVENT.size + length
+
+                if mask & IN_Q_OVERFLOW:  # Events got dropped, so anything could have changed
+                    changed.update(scan_tree(self.root))
+                elif mask & IN_IGNORED:
+                    self.dirs.pop(wd, None)
+                elif wd in self.dirs:
+                    path = os.path.join(self.dirs[wd], name)
+                    if mask & IN_ISDIR:
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            changed.update(self.add_tree(path))  # Files could have landed before the watch did
+                    elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and name.endswith(JSX_EXT):
+                        changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, root, interval=POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.files = scan_tree(root)
+
+    def changes(self, timeout=None):
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        files = scan_tree(self.root)
+        changed = {path for path, signature in files.items() if self.files.get(path) != signature}
+        self.files = files
+        return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(root, poll=False):
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):  # No inotify, or out of watches
+            pass
+    return PollingWatcher(root)
+
+
+# Converts the files whose signature differs from the one in snapshot, returning convert_file()'s results
+def convert_changes(paths, snapshot, use_dict=False, backend='scan', layout='indent', cache_config=None, mode='calls',
+                    header=False, trace_memory=None):
+    results = []
+    for src in sorted(paths):
+        try:
+            st = os.stat(src)
+        except FileNotFoundError:
+            snapshot.pop(src, None)
+            continue
+
+        signature = (st.st_mtime_ns, st.st_size)
+        if snapshot.get(src) == signature:
+            continue
+        snapshot[src] = signature
+        results.append(convert_file((src, output_path(src, os.path.dirname(src)), use_dict, backend, layout, cache_config, mode,
+                                     header, trace_memory)))
+    return results
+
+
+# Watches root until interrupted, or until stop (a threading.Event) gets set.  profile is a Profiler to merge the
+# reports of the conversions into, or None
+def run_watch(root, use_dict=False, backend='scan', cache=None, layout='indent', verbose=False, debounce=DEBOUNCE,
+              poll=False, idle_timeout=None, stop=None, mode='calls', header=False, profile=None):
+    cache_config = (cache.cache_dir, cache.max_size) if cache is not None else None
+    snapshot = scan_tree(root)
+    watcher = make_watcher(root, poll)
+    if verbose:
+        print(f"Watching {len(snapshot)} files under {root} ({type(watcher).__name__})")
+
+    pending = set()
+    try:
+        while stop is None or not stop.is_set():
+            changed = watcher.changes(debounce if pending else idle_timeout)
+            if changed:
+                pending |= changed
+                continue
+            if not pending:
+                continue
+
+            for src, _, _, error, report in convert_changes(pending, snapshot, use_dict, backend, layout, cache_config, mode,
+                                                             header, _trace_memory(profile)):
+                if report is not None:
+                    profile.merge(report)
+                if error:
+                    print(f"ERROR: {src}: {error}")
+                else:
+                    print(f"Converted {src}")
+            pending = set()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
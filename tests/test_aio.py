@@ -0,0 +1,104 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+import jsxtopy
+from jsxtopy import aio
+from jsxtopy.aio import AsyncConverter
+
+
+# Stands in for convert() and records how many conversions were running at once
+class SlowConvert:
+    def __init__(self, delay):
+        self.delay = delay
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, jsx, *args):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return jsx
+
+
+def test_convert():
+    async def main():
+        async with AsyncConverter(layout='compact') as converter:
+            return await converter.convert("""<div><Text size="xs">Hi</Text></div>"""), await converter.convert("""<br />""", use_dict=True)
+
+    assert asyncio.run(main()) == (jsxtopy.convert("""<div><Text size="xs">Hi</Text></div>""", layout='compact'), 'Br(None)')
+
+
+def test_convert_many_keeps_order():
+    snippets = [f"""<Text size="{i}">{i}</Text>""" for i in range(20)]
+    snippets[5] = """<div><b></div>"""
+
+    async def main():
+        async with AsyncConverter(max_workers=4) as converter:
+            return await converter.convert_many(snippets)
+
+    results = asyncio.run(main())
+    assert isinstance(results[5], ValueError)
+    assert results[:5] + results[6:] == [jsxtopy.convert(jsx) for i, jsx in enumerate(snippets) if i != 5]
+
+
+def test_concurrency_limit(monkeypatch):
+    slow = SlowConvert(0.05)
+    monkeypatch.setattr(aio, 'convert', slow)
+
+    async def main():
+        async with AsyncConverter(max_workers=8, max_concurrency=3) as converter:
+            return await converter.convert_many([str(i) for i in range(12)])
+
+    assert asyncio.run(main()) == [str(i) for i in range(12)]
+    assert slow.most_running == 3
+
+
+def test_timeout_keeps_slot_until_work_finishes(monkeypatch):
+    slow = SlowConvert(0.2)
+    monkeypatch.setattr(aio, 'convert', slow)
+
+    async def main():
+        async with AsyncConverter(max_workers=2, max_concurrency=1) as converter:
+            with pytest.raises(asyncio.TimeoutError):
+                await converter.convert('first', timeout=0.02)
+            return await converter.convert('second')
+
+    assert asyncio.run(main()) == 'second'
+    assert slow.most_running == 1
+
+
+def test_cancel_queued_conversion(monkeypatch):
+    slow = SlowConvert(0.1)
+    monkeypatch.setattr(aio, 'convert', slow)
+
+    async def main():
+        async with AsyncConverter(max_concurrency=1) as converter:
+            first = asyncio.create_task(converter.convert('first'))
+            queued = asyncio.create_task(converter.convert('queued'))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            return await first, await converter.convert('after')
+
+    assert asyncio.run(main()) == ('first', 'after')
+
+
+def test_process_executor():
+    async def main():
+        async with AsyncConverter(executor='process', max_workers=1) as converter:
+            return await converter.convert("""<div>Hi</div>""")
+
+    assert asyncio.run(main()) == 'Div(None, "Hi")'
+
+
+def test_bad_executor():
+    with pytest.raises(ValueError):
+        AsyncConverter(executor='fiber')
@@ -0,0 +1,40 @@
+import os
+
+from jsxtopy.batch import run_batch
+
+
+def make_snippets(tmp_path):
+    src = tmp_path / 'snippets'
+    (src / 'nested').mkdir(parents=True)
+    (src / 'button.jsx').write_text("""<Button radius="md">Settings</Button>""")
+    (src / 'nested' / 'grid.jsx').write_text("""<SimpleGrid cols={3}><div>1</div></SimpleGrid>""")
+    (src / 'nested' / 'broken.jsx').write_text("""<div><span></div>""")
+    (src / 'notes.txt').write_text("""<div>not a snippet</div>""")
+    return src
+
+
+def test_batch_writes_next_to_inputs(tmp_path):
+    src = make_snippets(tmp_path)
+
+    failures = run_batch([str(src)], workers=2)
+    assert [os.path.basename(path) for path, error in failures] == ['broken.jsx']
+    assert (src / 'button.py').read_text() == """Button({'radius': 'md'}, "Settings")\n"""
+    assert (src / 'nested' / 'grid.py').read_text() == """SimpleGrid({'cols': 3},\n    Div(None, "1")\n)\n"""
+    assert not (src / 'notes.py').exists()
+
+
+def test_batch_mirror_tree_from_glob(tmp_path):
+    src = make_snippets(tmp_path)
+    out = tmp_path / 'out'
+
+    failures = run_batch([str(src / '**' / 'g*.jsx')], out_dir=str(out), workers=1)
+    assert failures == []
+    assert (out / 'nested' / 'grid.py').exists()
+    assert not (src / 'nested' / 'grid.py').exists()
+
+
+def test_batch_mode_and_header(tmp_path):
+    src = make_snippets(tmp_path)
+
+    run_batch([str(src / 'button.jsx')], workers=1, mode='react', header=True)
+    assert (src / 'button.py').read_text() == """from pyreact import React\n\nReact.createElement(Button, {'radius': 'md'}, "Settings")\n"""
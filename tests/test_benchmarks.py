@@ -0,0 +1,41 @@
+import pytest
+
+import jsxtopy
+from benchmarks.corpus import SHAPES, generate, element_count
+import benchmarks.__main__
+from benchmarks.__main__ import find_regressions, run_benchmarks
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_corpus_is_seeded_and_converts(shape):
+    jsx = generate(shape, 10, seed=1)
+
+    assert jsx == generate(shape, 10, seed=1)
+    assert jsx != generate(shape, 10, seed=2) or shape == 'deep'
+    result = jsxtopy.run(jsx)
+    assert result.count('(') >= element_count(shape, 10)
+
+
+def test_find_regressions():
+    baseline = {'scan/wide/100': {'time': 1.0, 'peak': 1000}}
+    results = {'scan/wide/100': {'time': 1.1, 'peak': 2000}, 'scan/wide/200': {'time': 5.0, 'peak': 5000}}
+
+    regressions = find_regressions(results, baseline, 0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('scan/wide/100 peak')
+
+
+def test_failed_measurement_is_reported(monkeypatch, capsys):
+    def convert(jsx, use_dict):
+        if len(jsx) > 1000:
+            raise RecursionError("maximum recursion depth exceeded")
+        return jsxtopy.jsxtopy.jsxtopy_scan(jsx, use_dict)
+
+    monkeypatch.setitem(benchmarks.__main__.BACKENDS, 'scan', convert)
+    results = run_benchmarks(['scan'], ['deep'], [10, 100], 1, 0)
+
+    assert 'time' in results['scan/deep/10']
+    assert results['scan/deep/100']['error'].startswith('RecursionError')
+    assert 'FAILED: RecursionError' in capsys.readouterr().out
+    baseline = {name: {'time': 1e9, 'peak': 1e9} for name in results}
+    assert find_regressions(results, baseline, 0.25) == ['scan/deep/100 failed: RecursionError: maximum recursion depth exceeded']
@@ -0,0 +1,46 @@
+import os
+
+import jsxtopy
+from jsxtopy.cache import ConversionCache
+
+
+def test_cache_hit_skips_conversion(tmp_path, monkeypatch):
+    cache = ConversionCache(str(tmp_path))
+    jsx = """<div id="root">This is text</div>"""
+
+    first = jsxtopy.run(jsx, cache=cache)
+    monkeypatch.setitem(jsxtopy.jsxtopy.BACKENDS, 'scan', None)  # A hit must not touch the converter
+    second = jsxtopy.run(jsx, cache=cache)
+    assert first == second == """Div({'id': 'root'}, "This is text")"""
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_key_includes_options():
+    jsx = """<div id="root"></div>"""
+
+    assert ConversionCache.key(jsx, False, 'scan') != ConversionCache.key(jsx, True, 'scan')
+    assert ConversionCache.key(jsx, False, 'scan') != ConversionCache.key(jsx, False, 'lxml')
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ConversionCache(str(tmp_path), max_size=350)
+    for i in range(3):
+        cache.put(f'{i:064x}', 'x' * 100)
+        os.utime(cache._path(f'{i:064x}'), (i, i))
+    cache.get(f'{0:064x}')  # Entry 0 is now the most recently used
+    cache.put(f'{3:064x}', 'x' * 100)
+
+    assert cache.get(f'{0:064x}') is not None
+    assert cache.get(f'{1:064x}') is None
+    assert cache.get(f'{3:064x}') is not None
+
+
+def test_cache_size_kept_without_walking(tmp_path, monkeypatch):
+    cache = ConversionCache(str(tmp_path))
+    cache.put(f'{0:064x}', 'x' * 100)
+    cache.put(f'{0:064x}', 'x' * 50)  # Replaces the entry
+
+    monkeypatch.setattr(ConversionCache, '_entries', None)  # Writes under the size cap must not walk the cache
+    other = ConversionCache(str(tmp_path))
+    other.put(f'{1:064x}', 'x' * 25)
+    assert (tmp_path / 'size').read_text() == '75'
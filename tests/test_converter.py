@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import jsxtopy
+from jsxtopy import Converter
+from jsxtopy.literals import parse_value
+
+
+SNIPPETS = [
+    """<div id="root"><Button radius="md" size="lg" compact uppercase>Settings</Button></div>""",
+    """<><Input component="select" rightSection={<IconChevronDown size={14} />}><option value="1">1</option></Input></>""",
+    """<Slider marks={[{ value: 20, label: '20%' }, { value: 50, label: '50%' }]} />""",
+    """<Group><Badge size="xs">New</Badge><Badge size="xs">New</Badge><Badge size="xs">New</Badge></Group>""",
+]
+
+
+@pytest.mark.parametrize('mode', ['calls', 'hoist', 'react', 'table'])
+@pytest.mark.parametrize('layout', ['indent', 'compact'])
+def test_same_as_convert(mode, layout):
+    converter = Converter(use_dict=True, layout=layout, mode=mode)
+
+    for jsx in SNIPPETS * 2:
+        expected = jsxtopy.convert(jsx, use_dict=True, layout=layout, mode=mode)
+        assert converter.convert(jsx) == expected
+        assert ''.join(converter.iter_convert(jsx)) == expected
+
+
+def test_indent_width():
+    converter = Converter(indent=2)
+
+    assert converter.convert("""<div><Text>Hi</Text></div>""") == """Div(None,\n  Text(None, "Hi")\n)"""
+
+
+def test_header(tmp_path):
+    converter = Converter(mode='react', layout='compact', header=True)
+    path = tmp_path / 'out.py'
+
+    assert converter.convert("""<br />""") == """from pyreact import React\n\nReact.createElement('br', None)"""
+    converter.convert_to_file("""<br />""", path)
+    assert path.read_text() == """from pyreact import React\n\nReact.createElement('br', None)\n"""
+
+
+def test_own_bounded_memo():
+    converter = Converter(memo_size=200)
+    parse_value.cache_clear()
+
+    for i in range(300):
+        converter.convert(f"""<Text size="{i}" />""")
+    assert len(converter._values) == 200
+    assert len(converter._tags) <= 200
+    assert parse_value.cache_info().currsize == 0  # The module wide memo isn't used
+
+
+def test_shared_between_threads():
+    converter = Converter(layout='compact')
+    snippets = [f"""<Stack><Text size="{i % 7}" color="dimmed">{i}</Text>{SNIPPETS[i % len(SNIPPETS)]}</Stack>""" for i in range(400)]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(converter.convert, snippets))
+    assert results == [jsxtopy.convert(jsx, layout='compact') for jsx in snippets]
+
+
+@pytest.mark.parametrize('options', [dict(backend='dom'), dict(layout='wide'), dict(mode='tuples'), dict(backend='lxml', mode='react'),
+                                     dict(backend='lxml', indent=2)])
+def test_bad_options(options):
+    with pytest.raises(ValueError):
+        Converter(**options)
+
+
+def test_shares_cache_entries_with_convert(tmp_path):
+    from jsxtopy.cache import ConversionCache
+
+    cache = ConversionCache(str(tmp_path))
+    result = Converter(mode='react', cache=cache).convert(SNIPPETS[0])
+    assert jsxtopy.convert(SNIPPETS[0], mode='react', cache=cache) == result
+    assert (cache.hits, cache.misses) == (1, 1)
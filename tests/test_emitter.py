@@ -0,0 +1,57 @@
+import ast
+
+import jsxtopy
+from jsxtopy.scanner import scan
+from jsxtopy.jsxtopy import INDENT
+from jsxtopy.emitter import Builder, unparse
+
+
+def test_builder_makes_expression_tree():
+    call, = Builder().build(scan("""<div id="root"><Button size={14}>Settings</Button></div>"""))
+
+    assert isinstance(call, ast.Call) and call.func.id == 'Div'
+    props, button = call.args
+    assert isinstance(props, ast.Dict) and [k.value for k in props.keys] == ['id']
+    assert button.func.id == 'Button' and button.args[1].value == 'Settings'
+
+
+def test_dict_props_are_keywords():
+    call, = Builder(use_dict=True).build(scan("""<Button size={14} compact />"""))
+
+    assert [(keyword.arg, keyword.value.value) for keyword in call.args[0].keywords] == [('size', 14), ('compact', True)]
+
+
+def test_compact_layout():
+    jsx = """<>
+      <Input component="select" rightSection={<IconChevronDown size={14} />}>
+        <option value="1">1</option>
+      </Input>
+      <Slider marks={[{ value: 20, label: '20%' }]} />
+    </>"""
+
+    result = jsxtopy.run(jsx, layout='compact')
+    assert result == """Fragment(None, Input({'component': 'select', 'rightSection': "IconChevronDown({'size': 14})"}, Option({'value': 1}, "1")), Slider({'marks': [{'value': 20, 'label': '20%'}]}))"""
+    assert jsxtopy.run(jsx, use_dict=True, layout='compact').startswith("""Fragment(None, Input(dict(component='select', rightSection='IconChevronDown(dict(size=14))'), Option""")
+
+
+def test_unparse_indent_level():
+    calls = Builder().build(scan("""<div><span>a</span></div><br/>"""))
+
+    assert unparse(calls, level=2) == """Div(None,\n        Span(None, "a")\n    ),\n    Br(None)"""
+
+
+def test_deep_nesting_without_recursion():
+    depth = 10000
+    jsx = '<div>' * depth + '<Text size="xs" icon={<Icon />}>Leaf</Text>' + '</div>' * depth
+
+    result = jsxtopy.jsxtopy.jsxtopy_scan(jsx, False, layout='compact')
+    assert result == 'Div(None, ' * depth + """Text({'size': 'xs', 'icon': 'Icon(None)'}, "Leaf")""" + ')' * depth
+
+
+def test_deep_nesting_indent_layout():
+    depth = 1500
+    result = jsxtopy.jsxtopy.jsxtopy_scan('<div>' * depth + '</div>' * depth, False)
+
+    lines = result.split('\n')
+    assert len(lines) == 2 * depth - 1
+    assert lines[depth - 1] == ' ' * INDENT * (depth - 1) + 'Div(None)'
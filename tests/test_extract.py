@@ -0,0 +1,68 @@
+import pytest
+
+from jsxtopy.extract import extract, find_jsx, format_stub, run_extract
+
+
+SOURCE = """import React, { useState } from 'react';
+// A comment with <Fake /> JSX
+/* and <Another> one */
+const re = /<div>/g;
+const tpl = `template <b>${x ? '<i>' : `<u>`}</b>`;
+const s = "string with <span>";
+const identity = <T,>(x: T) => x;
+
+export function Demo({ items }: Props) {
+  const [value, setValue] = useState<string>('');
+  const icon = <IconCheck size={14} />;
+  const ratio = a < b ? 1 : 2;
+  return (
+    <Group position="center">
+      <TextInput rightSection={<Loader size="xs" />} label="Don't" />
+    </Group>
+  );
+}
+
+export default () => <>
+  <Text>Hi</Text>
+</>;
+"""
+
+
+def test_extract_locations_and_output():
+    results = extract(SOURCE)
+
+    assert [(line, column) for line, column, _, _, _ in results] == [(11, 16), (14, 5), (20, 22)]
+    assert [jsx.split()[0] for _, _, jsx, _, _ in results] == ['<IconCheck', '<Group', '<>']
+    assert results[0][3] == "IconCheck({'size': 14})"
+    assert results[2][3] == 'Fragment(None,\n    Text(None, "Hi")\n)'
+    assert all(error is None for *_, error in results)
+
+
+@pytest.mark.parametrize("source", [
+    """const a = b < c && d > e;""",
+    """const f = useRef<HTMLDivElement>(null);""",
+    """const s = 'it\\'s <b>not</b> JSX';""",
+    """const r = x.replace(/<br>/g, '');""",
+    """const t = `${a}<i>${`<b>`}</i>`;""",
+])
+def test_no_jsx(source):
+    assert list(find_jsx(source)) == []
+
+
+def test_unparseable_jsx_is_reported():
+    results = extract("""function f() {\n  return <div><span></div>;\n}""")
+
+    assert len(results) == 1
+    line, column, jsx, pyified, error = results[0]
+    assert (line, column, pyified) == (2, 10, None)
+    assert error.startswith('ValueError')
+
+
+def test_run_extract_stub(tmp_path):
+    src = tmp_path / 'Demo.tsx'
+    src.write_text(SOURCE, encoding='utf-8')
+
+    assert run_extract([str(tmp_path)], stub=True) == 0
+    stub = (tmp_path / 'Demo.py').read_text(encoding='utf-8')
+    assert stub == format_stub(str(src), extract(SOURCE))
+    assert f"# {src}:11:16\njsx_11_16 = IconCheck({{'size': 14}})\n" in stub
@@ -0,0 +1,79 @@
+import jsxtopy
+from jsxtopy.scanner import scan
+from jsxtopy.emitter import Builder
+from jsxtopy.hoist import hoist
+
+
+# Any capitalized name is an element function that returns what it was called with
+class Elements(dict):
+    def __missing__(self, name):
+        return lambda props, *children: (name, props, children)
+
+
+# Runs hoisted or plain output and returns the element tree it builds
+def evaluate(source):
+    code = source.split('\n', 1)[1] if source.startswith('#') else source
+    defs, _, body = code.rpartition('\n\n')
+    namespace = Elements()
+    exec(defs, {}, namespace)
+    return eval(f'({body},)', {}, namespace)
+
+
+def hoisted(jsx, use_dict=False, layout='indent'):
+    return hoist(Builder(use_dict).build(scan(jsx)), layout)
+
+
+def test_hoist_repeated_subtree():
+    result = hoisted("""<Group><Badge size="xs">New</Badge><Badge size="xs">New</Badge></Group>""")
+
+    assert result.split('\n', 1)[1] == """BADGE_1 = Badge({'size': 'xs'}, "New")
+
+Group(None,
+    BADGE_1,
+    BADGE_1
+)"""
+    assert result.startswith("# Hoisted 1 subtrees and 0 prop dicts:")
+    assert ", 2 fewer elements and 2 fewer prop dicts built per render" in result
+
+
+def test_hoist_shared_props():
+    jsx = """<Stack><Text size="sm" color="dimmed">a</Text><Text size="sm" color="dimmed">b</Text><Text size="sm" color="dimmed">c</Text></Stack>"""
+
+    result = hoisted(jsx, use_dict=True, layout='compact')
+    assert result.split('\n', 1)[1] == """PROPS_1 = dict(size='sm', color='dimmed')
+
+Stack(None, Text(PROPS_1, "a"), Text(PROPS_1, "b"), Text(PROPS_1, "c"))"""
+
+
+def test_small_subtrees_stay_inline():
+    result = hoisted("""<div><br /><br /></div>""")
+
+    assert result.split('\n', 1)[1] == jsxtopy.convert("""<div><br /><br /></div>""")
+
+
+def test_definitions_come_before_their_uses():
+    card = """<Card padding="lg"><IconCheck size={14} stroke={1.5} /><Text>Card body text</Text></Card>"""
+    jsx = f"""<Stack>{card}{card}<Group><IconCheck size={{14}} stroke={{1.5}} /><IconCheck size={{14}} stroke={{1.5}} /></Group></Stack>"""
+
+    result = hoisted(jsx)
+    lines = result.split('\n')
+    assert lines.index('ICONCHECK_1 = IconCheck({\'size\': 14, \'stroke\': 1.5})') < lines.index("CARD_1 = Card({'padding': 'lg'},")
+    assert evaluate(result) == evaluate(jsxtopy.convert(jsx))
+
+
+def test_jsx_attribute_values_are_not_hoisted_into():
+    jsx = """<div><Input icon={<IconSearch size={14} />} /><Input icon={<IconSearch size={14} />} /><IconSearch size={14} /></div>"""
+
+    result = hoisted(jsx)
+    assert """INPUT_1 = Input({'icon': "IconSearch({'size': 14})"})""" in result
+    assert evaluate(result) == evaluate(jsxtopy.convert(jsx))
+
+
+def test_deep_tree():
+    depth = 3000
+    leaf = """<Badge color="blue" size="xs">Leaf</Badge>"""
+    jsx = '<div>' * depth + leaf * 3 + '</div>' * depth
+
+    result = jsxtopy.convert(jsx, layout='compact', mode='hoist')
+    assert result.split('\n')[1] == """BADGE_1 = Badge({'color': 'blue', 'size': 'xs'}, "Leaf")"""
+    assert result.endswith('BADGE_1, BADGE_1, BADGE_1' + ')' * depth)
@@ -0,0 +1,78 @@
+from jsxtopy.jsxtopy import jsxtopy_scan
+from jsxtopy.scanner import scan
+from jsxtopy.incremental import IncrementalConverter, fingerprints
+
+
+def make_screen(sizes):
+    sections = '\n'.join(f"""    <Paper p="md">
+      <Title order={{3}}>Section {i}</Title>
+      <Group>
+        <Button size="{size}" compact>Save</Button>
+        <Button size="{size}" variant="outline">Cancel</Button>
+      </Group>
+    </Paper>""" for i, size in enumerate(sizes))
+    return f"""<Stack>\n{sections}\n</Stack>"""
+
+
+def test_incremental_matches_full_conversion():
+    converter = IncrementalConverter()
+    sizes = ['md'] * 20
+
+    jsx = make_screen(sizes)
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, False)
+    assert converter.converted == 1 + 20 * 2 + 3  # Identical Groups get reused within a single conversion too
+    assert converter.reused == 19
+
+    sizes[7] = 'lg'
+    jsx = make_screen(sizes)
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, False)
+    assert converter.converted == 5  # Stack, Paper, Group and the two edited Buttons
+    assert converter.reused == 19 + 1  # The other Papers plus the Title of the edited one
+
+    sizes[3] = 'xs'
+    jsx = make_screen(sizes)
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, False)
+    assert converter.converted == 5
+
+
+def test_incremental_reuses_subtrees_at_new_levels():
+    converter = IncrementalConverter(use_dict=True)
+
+    jsx = """<div><Text size="xs" rightSection={<Icon size={12} />}>A</Text></div>"""
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, True)
+
+    jsx = """<section><div><Text size="xs" rightSection={<Icon size={12} />}>A</Text></div></section>"""  # Deeper indentation
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, True)
+    assert (converter.converted, converter.reused) == (1, 1)
+
+
+def test_incremental_compact_layout():
+    converter = IncrementalConverter(layout='compact')
+
+    jsx = """<div><Text size="xs">A</Text><Text size="xs">B</Text></div>"""
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, False, 'compact') == """Div(None, Text({'size': 'xs'}, "A"), Text({'size': 'xs'}, "B"))"""
+
+
+def test_fingerprints_tell_trees_apart():
+    snippets = ["""<a b="x" />""", """<a>x</a>""", """<a b={<c />} />""", """<a><c /></a>""", """<a b="x" c="y" />""", """<a c="y" b="x" />"""]
+    keys = [fingerprints(elements)[id(elements[0])] for elements in map(scan, snippets)]
+    assert len(set(keys)) == len(snippets)
+
+
+def test_incremental_deep_edit():
+    converter = IncrementalConverter()
+    jsx = ''.join(f'<Box p="{i}">' for i in range(300)) + '<Text>x</Text><Text>y</Text>' + '</Box>' * 300
+    converter.convert(jsx)
+
+    jsx = jsx.replace('<Text>x', '<Text>z')
+    assert converter.convert(jsx) == jsxtopy_scan(jsx, False)
+    assert (converter.converted, converter.reused) == (301, 1)
+
+
+def test_incremental_tables_dont_grow():
+    converter = IncrementalConverter()
+    for i in range(50):
+        converter.convert(f"""<Stack><Text size="{i}">Hi</Text></Stack>""")
+
+    assert len(converter._values) == 1
+    assert len(converter._memo) == 2
@@ -53,7 +53,7 @@ def test_closed_component_with_jsx_component_attrib_value():
     jsx = """<TextInput label="Your email" placeholder="Your email" rightSection={<Loader size="xs" />} />"""
 
     result = jsxtopy.run(jsx)
-    assert result == """TextInput({'label': 'Your email', 'placeholder': 'Your email', 'rightsection': "Loader({'size': 'xs'})"})"""
+    assert result == """TextInput({'label': 'Your email', 'placeholder': 'Your email', 'rightSection': "Loader({'size': 'xs'})"})"""
 
 
 def test_component_fragment_with_jsx_component_attrib_value():
@@ -69,7 +69,7 @@ def test_component_fragment_with_jsx_component_attrib_value():
     result = jsxtopy.run(jsx)
     assert result == """Fragment(None,
     Input({'component': 'button'}, "Button input"),
-    Input({'component': 'select', 'rightsection': "IconChevronDown({'size': 14, 'stroke': 1.5})"},
+    Input({'component': 'select', 'rightSection': "IconChevronDown({'size': 14, 'stroke': 1.5})"},
         Option({'value': 1}, "1"),
         Option({'value': 2}, "2")
     )
@@ -85,7 +85,7 @@ def test_selfclosed_component_with_attrib_having_array_value():
             />"""
 
     result = jsxtopy.run(jsx)
-    assert result == """NativeSelect({'data': ['React', 'Vue', 'Angular', 'Svelte'], 'label': 'Select your favorite framework/library', 'description': 'This is anonymous', 'withasterisk': True})"""
+    assert result == """NativeSelect({'data': ['React', 'Vue', 'Angular', 'Svelte'], 'label': 'Select your favorite framework/library', 'description': 'This is anonymous', 'withAsterisk': True})"""
 
 
 def test_closed_component_with_attrib_having_array_value_usedict():
@@ -97,7 +97,7 @@ def test_closed_component_with_attrib_having_array_value_usedict():
             />"""
 
     result = jsxtopy.run(jsx, use_dict=True)
-    assert result == """NativeSelect(dict(data=['React', 'Vue', 'Angular', 'Svelte'], label='Select your favorite framework/library', description='This is anonymous', withasterisk=True))"""
+    assert result == """NativeSelect(dict(data=['React', 'Vue', 'Angular', 'Svelte'], label='Select your favorite framework/library', description='This is anonymous', withAsterisk=True))"""
 
 
 def test_closed_component_with_attrib_having_dict_value():
@@ -112,7 +112,7 @@ def test_closed_component_with_attrib_having_dict_value():
     />"""
 
     result = jsxtopy.run(jsx)
-    assert result == """Select({'maw': 320, 'mx': 'auto', 'label': 'Your favorite framework/library', 'placeholder': 'Pick one', 'data': ['React', 'Angular', 'Svelte', 'Vue'], 'transitionprops': {'transition': 'pop-top-left', 'duration': 80, 'timingFunction': 'ease'}, 'withinportal': True})"""
+    assert result == """Select({'maw': 320, 'mx': 'auto', 'label': 'Your favorite framework/library', 'placeholder': 'Pick one', 'data': ['React', 'Angular', 'Svelte', 'Vue'], 'transitionProps': {'transition': 'pop-top-left', 'duration': 80, 'timingFunction': 'ease'}, 'withinPortal': True})"""
 
 
 def test_component_withandwithout_attrib_and_children_and_numvals_and_text():
@@ -161,7 +161,7 @@ def test_closed_component_with_objectarray_and_function_as_attrib_values():
 />"""
 
     result = jsxtopy.run(jsx)
-    assert result == """MultiSelect({'valuecomponent': lambda value, label, image, name:  #  /* Your custom value component with data properties */,
+    assert result == """MultiSelect({'valueComponent': lambda value, label, image, name:  #  /* Your custom value component with data properties */,
   itemComponent=lambda value, label, image, name:  #  /* Your custom item component with data properties */, 
   data=[
     {
@@ -209,7 +209,7 @@ def test_nested_component_group_withandwithout_attrib_and_children_and_numvals_a
     Button({'variant': 'outline'}, "1"),
     Button({'variant': 'outline'}, "2"),
     Button({'p': 3, 'radius': 'sm md', 'size': 'lg', 'compact': True, 'uppercase': True}, "Settings"),
-    Switch({'labelposition': 'left', 'label': 'I agree to sell my privacy', 'size': 'md', 'radius': 'lg', 'color': 'red', 'disabled': True})
+    Switch({'labelPosition': 'left', 'label': 'I agree to sell my privacy', 'size': 'md', 'radius': 'lg', 'color': 'red', 'disabled': True})
 )"""
 
 
@@ -277,9 +277,9 @@ def test_nested_component_with_everything():
     assert result == """Group(None,
     Button({'variant': 'outline'}, "1"),
     Button({'variant': 'outline'}, "2"),
-    NativeSelect({'data': ['React', 'Vue', 'Angular', 'Svelte'], 'label': 'Select your favorite framework/library', 'description': 'This is anonymous', 'withasterisk': True}),
+    NativeSelect({'data': ['React', 'Vue', 'Angular', 'Svelte'], 'label': 'Select your favorite framework/library', 'description': 'This is anonymous', 'withAsterisk': True}),
     Button({'p': 5.2, 'radius': 'sm md', 'size': 'lg', 'compact': True, 'uppercase': True}, "Settings"),
-    Switch({'labelposition': 'left', 'label': 'I agree to sell my privacy', 'size': 'md', 'radius': 'lg', 'color': 'red', 'disabled': True, 'rightsection': "IconChevronDown({'size': 14, 'stroke': 1.5})"}),
+    Switch({'labelPosition': 'left', 'label': 'I agree to sell my privacy', 'size': 'md', 'radius': 'lg', 'color': 'red', 'disabled': True, 'rightSection': "IconChevronDown({'size': 14, 'stroke': 1.5})"}),
     SimpleGrid({'cols': 3},
         Div(None, "1"),
         Div({'mx': 7, 'my': 2}, "2"),
@@ -289,3 +289,75 @@ def test_nested_component_with_everything():
     ),
     MultiSelect({'data': 'data', 'label': 'Your favorite frameworks/libraries', 'placeholder': 'Pick all that you like'})
 )"""
+
+
+def test_convert_is_quiet(capsys):
+    jsx = """<div><Text size="xs">Hi</Text></div>"""
+
+    assert jsxtopy.convert(jsx) == jsxtopy.run(jsx)
+    capsys.readouterr()
+    jsxtopy.convert(jsx, use_dict=True, backend='lxml')
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize("layout", ['indent', 'compact'])
+def test_iter_convert_chunks(layout):
+    jsx = """<Group gap={4}><Text icon={<Icon />}>Hi</Text></Group>""" * 3000
+
+    chunks = list(jsxtopy.iter_convert(jsx, layout=layout))
+    assert len(chunks) > 1
+    assert ''.join(chunks) == jsxtopy.convert(jsx, layout=layout)
+
+
+def test_convert_to_file(tmp_path):
+    from jsxtopy.jsxtopy import convert_to_file
+
+    jsx = """<div><b>Bold</b></div><br />"""
+    path = tmp_path / 'out.py'
+    assert convert_to_file(jsx, path) == path.stat().st_size
+    assert path.read_text() == jsxtopy.convert(jsx) + '\n'
+
+    with pytest.raises(ValueError):
+        convert_to_file("""<div><b></div>""", tmp_path / 'bad.py')
+    assert not (tmp_path / 'bad.py').exists()
+
+
+def test_index_names():
+    from jsxtopy.jsxtopy import clean_vals, index_names
+
+    jsx_ = clean_vals("""<Input rightSection={<IconChevronDown strokeWidth={1.5} />}><option value="1">1</option></Input><br /><Text>x</Text>""")
+    index = index_names(jsx_)
+
+    assert [(tag, names) for tag, names, _, _ in index] == [('Input', {'rightsection': 'rightSection'}), ('br', {}), ('Text', {})]
+    tag, names, inner_start, inner_end = index[0]
+    assert jsx_[inner_start:inner_end] == """<option value="1">1</option>"""
+    assert index[1][2] == index[1][3]
+    assert [tag for tag, _, _, _ in index_names(clean_vals("""<img src="x.png"><span>after</span>"""))] == ['img', 'span']
+
+
+def test_lxml_keeps_name_case():
+    jsx = """<svg viewBox="0 0 24 24"><linearGradient gradientUnits="userSpaceOnUse" /><Input labelPosition="left">A</Input></svg>"""
+
+    assert jsxtopy.run(jsx, backend='lxml') == """Svg({'viewBox': '0 0 24 24'},
+    linearGradient({'gradientUnits': 'userSpaceOnUse'}),
+    Input({'labelPosition': 'left'}, "A")
+)"""
+    assert jsxtopy.run(jsx, backend='lxml') == jsxtopy.run(jsx, backend='scan')
+
+
+@pytest.mark.parametrize("jsx", ["""<div><br><b>x</b></div>""", """<img src="x.png"><span>after</span>""",
+                                 """<div><input type="text"><label>L</label></div>"""])
+def test_lxml_unclosed_void_tags(jsx):
+    assert jsxtopy.convert(jsx, backend='lxml') == jsxtopy.convert(jsx, backend='scan')
+
+
+def test_lxml_spaced_attribute():
+    assert jsxtopy.convert("""<div a = "1">x</div>""", backend='lxml') == """Div({'a': True, '=': '', '"1"': ''}, "x")"""
+
+
+@pytest.mark.parametrize("backend", ['scan', 'lxml'])
+def test_dev_sample(backend, capsys):
+    from jsxtopy.jsxtopy import run_dev
+
+    run_dev(False, backend)
+    assert 'valueComponent' in capsys.readouterr().out
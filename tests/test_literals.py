@@ -0,0 +1,57 @@
+import pytest
+
+import jsxtopy
+from jsxtopy.nodes import JSXElement
+from jsxtopy.literals import parse_value, parse_literal, NotLiteral
+
+
+@pytest.mark.parametrize("raw, value", [
+    (None, True),
+    ('"md"', 'md'),
+    ('"1"', 1),
+    ("'5.2'", 5.2),
+    ('"TRUE"', True),
+    ('"Tom &amp; Jerry"', 'Tom & Jerry'),
+    ('5', 5),
+    ('{14}', 14),
+    ('{-1.5}', -1.5),
+    ('{0x1F}', 31),
+    ('{1e3}', 1000.0),
+    ('{false}', False),
+    ('{null}', None),
+    ('{"5"}', '5'),
+    ("{'it\\'s'}", "it's"),
+    ('{`plain`}', 'plain'),
+    ("{['React', 'Vue', 'bob@handsome.inc']}", ['React', 'Vue', 'bob@handsome.inc']),
+    ("{{ transition: 'pop-top-left', 'duration': 80, }}", {'transition': 'pop-top-left', 'duration': 80}),
+    ("{[\n  { value: 20, label: '20%' }, // First\n  { value: 50, /* mid */ label: '50%' },\n]}", [{'value': 20, 'label': '20%'}, {'value': 50, 'label': '50%'}]),
+    ('{data}', 'data'),
+    ('{ items.map(item => item.label) }', 'items.map(item => item.label)'),
+    ('{[a, b]}', '[a, b]'),
+    ('{{ value }}', '{ value }'),
+    ('{`${count} items`}', '`${count} items`'),
+])
+def test_parse_value(raw, value):
+    assert parse_value(raw) == value
+
+
+def test_nested_jsx_literal():
+    icon, = parse_value('{[<IconX size={12} />]}')
+
+    assert isinstance(icon, JSXElement) and icon.tag == 'IconX'
+    assert jsxtopy.run("""<Tabs icons={[<IconX size={12} />]} />""") == """Tabs({'icons': ["IconX({'size': 12})"]})"""
+
+
+def test_repeated_values_are_parsed_once():
+    jsx = """<Group>""" + """<Button size="md" data={['a', 'b']} />""" * 50 + """</Group>"""
+    parse_value.cache_clear()
+
+    jsxtopy.run(jsx)
+    assert (parse_value.cache_info().misses, parse_value.cache_info().hits) == (2, 0)
+    jsxtopy.run(jsx)
+    assert (parse_value.cache_info().misses, parse_value.cache_info().hits) == (2, 2)
+
+
+def test_not_literal():
+    with pytest.raises(NotLiteral):
+        parse_literal('onClick()')
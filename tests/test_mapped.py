@@ -0,0 +1,79 @@
+import tracemalloc
+
+import pytest
+
+import jsxtopy
+from jsxtopy import Converter
+from jsxtopy.mapped import iter_convert_mapped, convert_mapped
+
+
+SNIPPETS = [
+    """<div id="root"><Button radius="md" size="lg" compact uppercase>Settings</Button><Text>x</Text></div>""",
+    """<><Input component="select" rightSection={<IconChevronDown size={14} />}><option value="1">1</option></Input></>
+<br />
+<Text>Fish &amp; chips</Text><Slider marks={[{ value: 20, label: '20%' }]} />""",
+    """<Text size="xs">Only text</Text>""",
+    """<svg viewBox="0 0 24 24"><linearGradient id="g"><stop offset="0" /></linearGradient><path d="M12 2L2 7" /></svg>""",
+]
+
+
+def write(tmp_path, jsx):
+    path = tmp_path / 'page.jsx'
+    path.write_text(jsx, encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('jsx', SNIPPETS)
+@pytest.mark.parametrize('mode', ['calls', 'react'])
+@pytest.mark.parametrize('layout', ['indent', 'compact'])
+def test_same_as_convert(tmp_path, jsx, mode, layout):
+    path = write(tmp_path, jsx)
+    converter = Converter(layout=layout, mode=mode)
+
+    for window in (1, 5, 1024):  # Tiny windows make every element run off the end of the decoded text
+        assert ''.join(iter_convert_mapped(path, converter, window)) == jsxtopy.convert(jsx, layout=layout, mode=mode)
+
+
+def test_multibyte_text_across_windows(tmp_path):
+    jsx = """<Group><Text>Crème brûlée ☕</Text><Text>日本語</Text></Group>"""
+    path = write(tmp_path, '﻿' + jsx)
+
+    assert ''.join(iter_convert_mapped(path, Converter(), 3)) == jsxtopy.convert(jsx)
+
+
+def test_convert_mapped(tmp_path):
+    path = write(tmp_path, """<div><br /></div>""")
+    out_path = tmp_path / 'page.py'
+
+    written = Converter(mode='react', layout='compact', header=True).convert_mapped(path, out_path)
+    assert out_path.read_text() == """from pyreact import React\n\nReact.createElement('div', None, React.createElement('br', None))\n"""
+    assert written == len(out_path.read_text())
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        convert_mapped(write(tmp_path, """<div class="x"""), tmp_path / 'out.py', Converter(), 4)
+    assert not (tmp_path / 'out.py').exists()
+    with pytest.raises(ValueError):
+        ''.join(iter_convert_mapped(write(tmp_path, """<div><Text>Hi</Text>"""), Converter(), 4))
+    with pytest.raises(ValueError):
+        ''.join(iter_convert_mapped(write(tmp_path, """<div><Text>Hi</Text></span>"""), Converter()))
+    with pytest.raises(ValueError):
+        ''.join(iter_convert_mapped(write(tmp_path, """<div />"""), Converter(mode='hoist')))
+
+
+def test_memory_bounded_by_largest_child(tmp_path):
+    child = """<Group position="apart" mt="md"><Text size="sm" color="dimmed">Item {i}</Text><Badge color="pink">On Sale</Badge></Group>\n"""
+    jsx = '<Stack>\n' + ''.join(child.replace('{i}', str(i)) for i in range(2000)) + '</Stack>\n'
+    converter = Converter()
+    ''.join(iter_convert_mapped(write(tmp_path, child), converter))  # Leave out the first use's imports and memo entries
+    path = write(tmp_path, jsx)
+
+    tracemalloc.start()
+    try:
+        size = sum(len(chunk) for chunk in iter_convert_mapped(path, converter, 8 * 1024))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert size == len(jsxtopy.convert(jsx))
+    assert peak < len(jsx) / 4
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from jsxtopy.scanner import scan
+from jsxtopy.nodes import JSXElement, EMPTY, walk, ir_size
+from benchmarks.corpus import generate, element_count
+
+
+def test_elements_keep_original_case_and_order():
+    div, = scan("""<div><TextInput rightSection={<Loader size="xs" />} withAsterisk /><br/>text</div>""")
+
+    assert isinstance(div, JSXElement)
+    assert [element.tag for element in walk([div])] == ['div', 'TextInput', 'Loader', 'br']
+    text_input, br = div.elements
+    assert [name for name, _ in text_input.attribs] == ['rightSection', 'withAsterisk']
+    assert div.text == 'text'
+    assert br.attribs is EMPTY and br.children is EMPTY
+
+
+def test_names_and_short_values_are_shared():
+    first, second = scan("""<Text size="md">1</Text><Text size="md">2</Text>""")
+
+    assert first.tag is second.tag
+    assert first.attribs[0][0] is second.attribs[0][0]
+    assert first.attribs[0][1] is second.attribs[0][1]
+
+
+def test_ir_memory_budget():
+    elements = scan(generate('wide', 1000))
+
+    assert ir_size(elements) / element_count('wide', 1000) < 512  # Bytes per element
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason="Measuring resident memory needs /proc")
+@pytest.mark.parametrize("shape", ['wide', 'jsx_attribs'])
+def test_ir_smaller_than_lxml_tree(shape):
+    from benchmarks.memory import measure
+
+    ir_rss, _ = measure('scan', shape, 4000)
+    lxml_rss, _ = measure('lxml', shape, 4000)
+    assert ir_rss < lxml_rss * 0.75
+
+
+def test_attribs_shared_between_elements():
+    first, second, third = scan("""<Icon size={14} stroke={1.5} /><Icon size={14} stroke={1.5} /><Icon size={16} stroke={1.5} />""")
+
+    assert first.attribs is second.attribs
+    assert third.attribs[1] is first.attribs[1]
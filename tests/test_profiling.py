@@ -0,0 +1,95 @@
+import sys
+import json
+import subprocess
+
+import jsxtopy
+from jsxtopy import profiling
+from jsxtopy.profiling import Profiler
+from jsxtopy.literals import parse_value
+
+
+JSX = """<div id="root"><Button size={14} data={[<Icon />]} compact>Settings</Button><p>Hi</p></div>"""
+
+
+def test_scan_phases():
+    parse_value.cache_clear()  # Memoized values skip the literal parser and its reparses
+    profiler = Profiler()
+    pyified = jsxtopy.run(JSX, profile=profiler)
+
+    assert pyified == jsxtopy.run(JSX)
+    report = profiler.report()
+    assert report['conversions'] == 1
+    assert {'scan', 'build', 'literals', 'emit'} <= set(report['phases'])
+    assert report['phases']['scan']['calls'] == 1
+    assert report['counters'] == {'max_depth': 2, 'reparses': 1}
+
+
+def test_lxml_phases():
+    profiler = Profiler()
+    jsxtopy.run("""<div><Text size="xs">1</Text><Text>2</Text></div>""", backend='lxml', profile=profiler)
+
+    report = profiler.report()
+    assert {'clean_vals', 'lxml_parse', 'tag_scan', 'fmt_val', 'assemble'} <= set(report['phases'])
+    assert report['phases']['lxml_parse']['calls'] == 2
+    assert report['counters']['reparses'] == 1
+
+
+def test_phase_times_are_exclusive():
+    profiler = Profiler(trace_memory=False)
+    with profiling.profiling(profiler):
+        with profiling.phase('outer'):
+            with profiling.phase('inner'):
+                sum(range(100000))
+
+    outer, inner = profiler.phases['outer'], profiler.phases['inner']
+    assert inner[0] > outer[0]
+    assert outer[0] + inner[0] <= profiler.total_seconds
+
+
+def test_inactive_profiler():
+    assert profiling.current() is None
+    assert profiling.phase('scan') is profiling.phase('emit')
+    profiling.count('reparses')
+
+
+def test_merge():
+    first, second = Profiler(), Profiler()
+    for profiler, jsx in ((first, JSX), (second, """<div><p><b>Deep</b></p></div>""")):
+        with profiling.profiling(profiler):
+            jsxtopy.jsxtopy.jsxtopy_scan(jsx, False)
+
+    first.merge(second.report())
+    assert first.conversions == 2
+    assert first.phases['scan'][1] == 2
+    assert first.counters['max_depth'] == 3
+
+
+def test_cli_json_report():
+    result = subprocess.run([sys.executable, '-c', 'import sys; from jsxtopy import main; sys.argv[0] = "jsxtopy"; main()',
+                             '--profile', 'json', JSX], check=True, capture_output=True, text=True)
+
+    assert result.stdout.startswith('\nDiv(')
+    report = json.loads(result.stderr)
+    assert report['conversions'] == 1
+    assert set(report['phases']['scan']) == {'seconds', 'calls', 'bytes'}
+
+
+def test_cli_batch_report(tmp_path):
+    for i in range(3):
+        (tmp_path / f'{i}.jsx').write_text(JSX)
+    result = subprocess.run([sys.executable, '-c', 'import sys; from jsxtopy import main; sys.argv[0] = "jsxtopy"; main()',
+                             '--profile', 'json', '-j', '2', '--batch', str(tmp_path)], capture_output=True, text=True)
+
+    assert result.returncode == 0
+    report = json.loads(result.stderr)
+    assert report['conversions'] == 3
+    assert report['phases']['scan']['calls'] == 3
+
+
+def test_stream_report():
+    import io
+    from jsxtopy.stream import run_stream
+
+    profiler = Profiler()
+    run_stream(io.StringIO('{"jsx": "<br />"}\n{"jsx": "<div />"}\n'), io.StringIO(), profile=profiler)
+    assert profiler.conversions == 2
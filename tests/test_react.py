@@ -0,0 +1,43 @@
+import jsxtopy
+
+
+def test_react_mode():
+    jsx = """<><div id="root"><Button size="lg" compact>Settings</Button></div><Menu.Item>Copy</Menu.Item></>"""
+
+    result = jsxtopy.convert(jsx, mode='react')
+    assert result == """React.createElement(React.Fragment, None,
+    React.createElement('div', {'id': 'root'},
+        React.createElement(Button, {'size': 'lg', 'compact': True}, "Settings")
+    ),
+    React.createElement(Menu.Item, None, "Copy")
+)"""
+
+
+def test_jsx_values_and_prop_names():
+    jsx = """<TextInput className="field" rightSection={<IconChevronDown size={14} />} data={[{label: <b>A</b>}]} />"""
+
+    result = jsxtopy.convert(jsx, use_dict=True, layout='compact', mode='react')
+    assert result == ("React.createElement(TextInput, dict(className='field', rightSection=React.createElement(IconChevronDown, dict(size=14)), "
+                      "data=[{'label': React.createElement('b', None, \"A\")}]))")
+
+
+def test_header():
+    jsx = """<div><span>a</span><span>b</span></div>"""
+
+    result = jsxtopy.convert(jsx, layout='compact', mode='react', header=True)
+    assert result == """from pyreact import React\n\nReact.createElement('div', None, React.createElement('span', None, "a"), React.createElement('span', None, "b"))"""
+    assert ''.join(jsxtopy.iter_convert(jsx, layout='compact', mode='react', header=True)) == result
+    assert jsxtopy.convert(jsx, mode='calls', header=True) == jsxtopy.convert(jsx)
+
+
+def test_output_runs():
+    class React:
+        Fragment = 'Fragment'
+
+        @staticmethod
+        def createElement(type_, props, *children):
+            return type_, props, children
+
+    jsx = """<><Group position="apart"><Badge>New</Badge><a href="#">Link</a></Group></>"""
+    result = eval(jsxtopy.convert(jsx, mode='react'), {'React': React, 'Group': 'Group', 'Badge': 'Badge'})
+    assert result == ('Fragment', None, (('Group', {'position': 'apart'}, (('Badge', None, ('New',)), ('a', {'href': '#'}, ('Link',)))),))
@@ -0,0 +1,69 @@
+import pytest
+
+import jsxtopy
+from jsxtopy.scanner import scan
+
+
+# Drops the source spans so tests can compare structure only
+def shape(elements):
+    return [[element.tag, [(k, shape(v) if isinstance(v, list) else v) for k, v in element.attribs],
+             [child if isinstance(child, str) else shape([child])[0] for child in element.children]]
+            for element in elements]
+
+
+def test_scan_elements_attribs_and_text():
+    jsx = """<div id="root"><Button size={14} data={['a', 'b']} compact>Settings</Button></div>"""
+
+    result = shape(scan(jsx))
+    assert result == [['div', [('id', '"root"')], [
+        ['Button', [('size', '{14}'), ('data', "{['a', 'b']}"), ('compact', None)], ['Settings']]
+    ]]]
+
+
+def test_scan_jsx_attrib_value():
+    jsx = """<TextInput rightSection={<Loader size="xs" />} label="Email" />"""
+
+    result = shape(scan(jsx))
+    assert result == [['TextInput', [('rightSection', [['Loader', [('size', '"xs"')], []]]), ('label', '"Email"')], []]]
+
+
+def test_scan_expression_with_braces_in_strings_and_comments():
+    jsx = """<Select styles={{ label: '}' /* } */ }} />"""
+
+    result = shape(scan(jsx))
+    assert result == [['Select', [('styles', "{{ label: '}' /* } */ }}")], []]]
+
+
+def test_scan_source_spans():
+    jsx = """<div> <br> <Text size="xs" /></div>"""
+
+    div, = scan(jsx)
+    assert (div.start, div.end) == (0, len(jsx))
+    assert [jsx[child.start:child.end] for child in div.elements] == ['<br>', '<Text size="xs" />']
+
+
+def test_scan_mismatched_closing_tag():
+    with pytest.raises(ValueError):
+        scan("""<div><span></div></span>""")
+
+
+def test_scan_unclosed_tag():
+    with pytest.raises(ValueError):
+        scan("""<div><span></span>""")
+
+
+@pytest.mark.parametrize("jsx", [
+    """<div id="root"><Button radius="md" size="lg" compact uppercase>Settings</Button></div>""",
+    """<>
+      <Input component="button">Button input</Input>
+      <Input component="select" rightSection={<IconChevronDown size={14} stroke={1.5} />}>
+        <option value="1">1</option>
+        <option value="2">2</option>
+      </Input>
+    </>""",
+    """<Select maw={320} data={['React', 'Angular']} transitionProps={{ transition: 'pop-top-left', duration: 80 }} withinPortal />""",
+    """<SimpleGrid cols={3}><Text variant="outline">1</Text><Text>2</Text></SimpleGrid>""",
+])
+@pytest.mark.parametrize("use_dict", [False, True])
+def test_backends_match(jsx, use_dict):
+    assert jsxtopy.run(jsx, use_dict, backend='scan') == jsxtopy.run(jsx, use_dict, backend='lxml')
@@ -0,0 +1,67 @@
+import io
+import os
+import struct
+import threading
+
+import pytest
+
+from jsxtopy.server import ConversionServer, Client, read_frame, write_frame
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    server = ConversionServer(lru_size=2)
+    path = str(tmp_path / 'jsxtopy.sock')
+    unix_server = server.make_unix_server(path)
+    thread = threading.Thread(target=unix_server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    unix_server.shutdown()
+    unix_server.server_close()
+    os.remove(path)
+
+
+def test_convert_and_stats(socket_path):
+    with Client(socket_path) as client:
+        assert client.convert("""<div id="root">Hello</div>""") == """Div({'id': 'root'}, "Hello")"""
+        assert client.convert("""<div id="root">Hello</div>""") == """Div({'id': 'root'}, "Hello")"""
+        assert client.convert("""<Button compact />""", use_dict=True) == """Button(dict(compact=True))"""
+        with pytest.raises(ValueError):
+            client.convert("""<div>""")
+
+        stats = client.stats()
+    assert (stats['requests'], stats['conversions'], stats['errors'], stats['hits']) == (5, 4, 1, 1)
+    assert stats['hit_ratio'] == 0.25
+    assert 0 <= stats['p50_ms'] <= stats['p99_ms']
+
+
+def test_concurrent_clients(socket_path):
+    results = {}
+
+    def convert(i):
+        with Client(socket_path) as client:
+            results[i] = [client.convert(f"""<Text size={{{i}}}>{j}</Text>""") for j in range(20)]
+
+    threads = [threading.Thread(target=convert, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results[3][5] == """Text({'size': 3}, "5")"""
+    assert len(results) == 8
+
+
+def test_stdio_frames():
+    infile = io.BytesIO()
+    write_frame(infile, {'op': 'convert', 'jsx': '<br/>'})
+    write_frame(infile, {'op': 'stats'})
+    infile.write(struct.pack('>I', 3) + b'{x}')
+    infile.seek(0)
+    outfile = io.BytesIO()
+
+    ConversionServer().serve_streams(infile, outfile)
+    outfile.seek(0)
+    assert read_frame(outfile) == {'py': 'Br(None)'}
+    assert read_frame(outfile)['conversions'] == 1
+    assert 'error' in read_frame(outfile)
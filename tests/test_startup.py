@@ -0,0 +1,38 @@
+import sys
+import time
+import subprocess
+
+import pytest
+
+
+IMPORT_BUDGET = 0.15  # Seconds on top of a bare interpreter start
+HELP_BUDGET = 0.25
+
+
+def wall_time(args):
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.fixture(scope='module')
+def interpreter_time():
+    return wall_time(['-c', 'pass'])
+
+
+def test_import_skips_heavy_modules():
+    heavy = "{'lxml', 'pyperclip', 'pytest', 'tracemalloc'}"
+    result = subprocess.run([sys.executable, '-c', f"import sys, jsxtopy; print(sorted({heavy} & set(sys.modules)))"],
+                            check=True, capture_output=True, text=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_import_time_budget(interpreter_time):
+    assert wall_time(['-c', 'import jsxtopy']) - interpreter_time < IMPORT_BUDGET
+
+
+def test_help_time_budget(interpreter_time):
+    assert wall_time(['-c', 'import sys; from jsxtopy import main; sys.argv[0] = "jsxtopy"; main()', '--help']) - interpreter_time < HELP_BUDGET
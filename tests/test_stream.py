@@ -0,0 +1,42 @@
+import io
+import json
+
+from jsxtopy.stream import run_stream
+
+
+def test_stream_results_and_errors():
+    records = [
+        {'id': 1, 'jsx': """<div id="root">Hello</div>"""},
+        {'id': 'b', 'jsx': """<Button radius="md" compact />""", 'dict': True},
+        {'id': 3, 'jsx': """<div><span></div>"""},
+        {'id': 4},
+    ]
+    infile = io.StringIO(''.join(f"{json.dumps(record)}\n" for record in records) + "\nnot json\n")
+    outfile = io.StringIO()
+
+    errors = run_stream(infile, outfile)
+    results = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert errors == 3
+    assert results[0] == {'id': 1, 'py': """Div({'id': 'root'}, "Hello")"""}
+    assert results[1] == {'id': 'b', 'py': """Button(dict(radius='md', compact=True))"""}
+    assert [result['id'] for result in results[2:]] == [3, 4, None]
+    assert all('error' in result for result in results[2:])
+
+
+def test_stream_oversized_record():
+    infile = io.StringIO(f"{json.dumps({'id': 1, 'jsx': '<div>' + 'x' * 100 + '</div>'})}\n{json.dumps({'id': 2, 'jsx': '<br/>'})}\n")
+    outfile = io.StringIO()
+
+    errors = run_stream(infile, outfile, max_record_size=50)
+    results = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert errors == 1
+    assert 'error' in results[0]
+    assert results[1] == {'id': 2, 'py': 'Br(None)'}
+
+
+def test_stream_mode():
+    infile = io.StringIO(f"{json.dumps({'id': 1, 'jsx': '<br/>'})}\n")
+    outfile = io.StringIO()
+
+    assert run_stream(infile, outfile, mode='react') == 0
+    assert json.loads(outfile.getvalue()) == {'id': 1, 'py': "React.createElement('br', None)"}
@@ -0,0 +1,68 @@
+import jsxtopy
+from jsxtopy.table import bundle, run_bundle
+
+
+ICON = """<svg xmlns="http://www.w3.org/2000/svg" width={24} height={24} viewBox="0 0 24 24" strokeWidth="2" stroke="currentColor" fill="none">
+  <path stroke="none" d="M0 0h24v24H0z" fill="none" />
+  <path d="M5 12l5 5l10 -10" />
+</svg>"""
+
+
+class React:
+    Fragment = 'Fragment'
+
+    @staticmethod
+    def createElement(type_, props, *children):
+        return type_, props, children
+
+
+# Runs table or react output and returns what React.createElement() was called with
+def render(source, **names):
+    namespace = {'React': React, **names}
+    defs, _, body = source.rpartition('\n\n\n')
+    exec(defs, namespace)
+    return eval(body, namespace)
+
+
+def test_table_mode():
+    result = jsxtopy.convert("""<svg viewBox="0 0 24 24"><path d="M5 12l5 5l10 -10" /></svg>""", mode='table')
+
+    assert result.startswith('# Table output: ')
+    assert "\nTAGS = ('svg', 'path')\nKEYS = ('viewBox', 'd')\n" in result
+    assert result.endswith("\n_build((0, (0, '0 0 24 24'), (1, (1, 'M5 12l5 5l10 -10'))))")
+
+
+def test_builds_same_elements_as_react_mode():
+    jsx = """<><Group position="apart"><Text size="sm">Fish &amp; chips</Text><Input icon={<IconSearch size={14} />} data={[{label: <b>A</b>}]} /></Group>
+<br /></>"""
+    names = {'Group': 'Group', 'Text': 'Text', 'Input': 'Input', 'IconSearch': 'IconSearch'}
+
+    assert render(jsxtopy.convert(jsx, mode='table'), **names) == render(jsxtopy.convert(jsx, mode='react'), **names)
+    assert render(jsxtopy.convert(ICON, use_dict=True, mode='table')) == render(jsxtopy.convert(ICON, mode='react'))
+
+
+def test_bundle():
+    icons = [(f'icon-{i}', ICON.replace('M5 12', f'M{i} 12')) for i in range(20)]
+    failures = []
+    source = bundle(icons + [('broken', '<svg><path></svg>')], failures=failures)
+
+    assert failures[0][0] == 'broken'
+    assert source.startswith('# Bundled 20 fragments: ')
+    assert 'smaller than the calls output' in source.split('\n', 1)[0]
+    assert source.count('TAGS = ') == 1
+
+    namespace = {'React': React}
+    exec(source.replace('from pyreact import React\n', ''), namespace)
+    assert namespace['fragment']('icon-3') == render(jsxtopy.convert(icons[3][1], mode='react'))
+
+
+def test_run_bundle(tmp_path, capsys):
+    for name in ['check', 'outline/alarm']:
+        path = tmp_path / 'icons' / f'{name}.jsx'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(ICON)
+    out_path = tmp_path / 'icons.py'
+
+    assert run_bundle([str(tmp_path / 'icons')], str(out_path)) == []
+    assert "    'outline/alarm': (0, " in out_path.read_text()
+    assert capsys.readouterr().out.startswith('Bundled 2 fragments: ')
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+from jsxtopy.watch import InotifyWatcher, PollingWatcher, convert_changes, run_watch, scan_tree
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def wait_for(path, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            raise TimeoutError(path)
+        time.sleep(0.02)
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def test_scan_tree(tmp_path):
+    write(tmp_path / 'a.jsx', '<div />')
+    write(tmp_path / 'sub' / 'b.jsx', '<p>Hi</p>')
+    write(tmp_path / 'sub' / 'c.py', '')
+
+    files = scan_tree(str(tmp_path))
+    assert sorted(os.path.relpath(path, tmp_path) for path in files) == ['a.jsx', os.path.join('sub', 'b.jsx')]
+    assert files[str(tmp_path / 'a.jsx')][1] == 7
+
+
+def test_convert_changes_skips_unchanged(tmp_path):
+    src = str(tmp_path / 'a.jsx')
+    write(src, '<div>Hi</div>')
+    snapshot = {}
+
+    assert [result[0] for result in convert_changes({src}, snapshot)] == [src]
+    assert convert_changes({src}, snapshot) == []
+    assert wait_for(str(tmp_path / 'a.py')) == 'Div(None, "Hi")\n'
+
+    os.remove(src)
+    assert convert_changes({src}, snapshot) == []
+    assert snapshot == {}
+
+
+def test_convert_changes_mode(tmp_path):
+    src = str(tmp_path / 'a.jsx')
+    write(src, '<div>Hi</div>')
+
+    convert_changes({src}, {}, mode='react', layout='compact')
+    assert wait_for(str(tmp_path / 'a.py')) == """React.createElement('div', None, "Hi")\n"""
+
+
+def test_polling_watcher(tmp_path):
+    write(tmp_path / 'a.jsx', '<div />')
+    watcher = PollingWatcher(str(tmp_path), interval=0.01)
+    assert watcher.changes() == set()
+
+    write(tmp_path / 'sub' / 'b.jsx', '<p />')
+    write(tmp_path / 'a.jsx', '<div>Changed</div>')
+    assert watcher.changes() == {str(tmp_path / 'a.jsx'), str(tmp_path / 'sub' / 'b.jsx')}
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux only")
+def test_inotify_watcher(tmp_path):
+    watcher = InotifyWatcher(str(tmp_path))
+    try:
+        assert watcher.changes(0.01) == set()
+
+        write(tmp_path / 'a.jsx', '<div />')
+        write(tmp_path / 'notes.txt', '')
+        assert watcher.changes(1) == {str(tmp_path / 'a.jsx')}
+
+        os.makedirs(tmp_path / 'sub')
+        write(tmp_path / 'sub' / 'b.jsx', '<p />')
+        changed = watcher.changes(1)
+        changed |= watcher.changes(0.1)  # The file's own event when the new directory got watched in time
+        assert changed == {str(tmp_path / 'sub' / 'b.jsx')}
+    finally:
+        watcher.close()
+
+
+@pytest.mark.parametrize("poll", [False, True])
+def test_run_watch(tmp_path, poll, capsys):
+    write(tmp_path / 'old.jsx', '<div />')
+    stop = threading.Event()
+    thread = threading.Thread(target=run_watch, args=(str(tmp_path),),
+                              kwargs=dict(debounce=0.05, poll=poll, idle_timeout=0.05, stop=stop))
+    thread.start()
+    try:
+        time.sleep(0.1)
+        write(tmp_path / 'sub' / 'new.jsx', '<Text size="xs">Hi</Text>')
+        assert wait_for(str(tmp_path / 'sub' / 'new.py')) == "Text({'size': 'xs'}, \"Hi\")\n"
+    finally:
+        stop.set()
+        thread.join()
+
+    assert not os.path.exists(tmp_path / 'old.py')  # Only changed files get converted